@@ -1,17 +1,29 @@
-import pandas as pd
 from pathlib import Path
-from app_modules.compare_logic import build_compare_dataframe, read_dictionary, read_json_map
+from app_modules.compare_logic import build_compare_dataframe, read_dictionary, read_json_maps
+from app_modules.storage_utils import memoize_compare
 
 base = Path(r"C:\Users\rotemSRS\Desktop\automatic_tool_storage")
-d, _ = read_dictionary(base / "dictionary_latest.xlsx")
-ko = read_json_map(base / "ko_latest.json")
-ru = read_json_map(base / "ru_latest.json")
-en = read_json_map(base / "en_latest.json")
-out, _ = build_compare_dataframe(d,ko,ru,en,False,'Main Modulew','English','Korean','Russian')
+source_paths = {
+    'dictionary': base / "dictionary_latest.xlsx",
+    'ko': base / "ko_latest.json",
+    'ru': base / "ru_latest.json",
+    'en': base / "en_latest.json",
+}
+
+
+# 같은 입력/코드로 다시 실행하면 디스크에 캐시된 비교 결과를 재사용
+@memoize_compare
+def compare(source_paths, module_col, english_col, korean_col, russian_col):
+    d, _ = read_dictionary(source_paths['dictionary'], usecols=[module_col, english_col, korean_col, russian_col])
+    ko, ru, en = read_json_maps([source_paths['ko'], source_paths['ru'], source_paths['en']])
+    return build_compare_dataframe(d, ko, ru, en, False, module_col, english_col, korean_col, russian_col)
+
+
+out, _ = compare(source_paths, 'Main Modulew', 'English', 'Korean', 'Russian')
+by_en = out.drop_duplicates('Dictionary English').set_index('Dictionary English')
 for key in ['Car','Train/Car Management','List','Project','Code','w']:
-    x = out[out['Dictionary English']==key]
-    if x.empty:
+    if key not in by_en.index:
         print(key, 'NOT FOUND')
     else:
-        r=x.iloc[0]
+        r=by_en.loc[key]
         print(key, 'ko=',repr(r['ko.json']), 'ru=',repr(r['ru.json']), 'en=',repr(r['en.json']), 'KM=',r['KO_Match'],'RM=',r['RU_Match'],'EM=',r['EN_Match'])
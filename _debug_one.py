@@ -1,19 +1,31 @@
-import pandas as pd
-from app import compare_records_from_sources
-
 source_paths={
 'dictionary':r'C:\Users\rotemSRS\Desktop\automatic_tool_storage\dictionary_latest.xlsx',
 'ko':r'C:\Users\rotemSRS\Desktop\automatic_tool_storage\ko_latest.json',
 'ru':r'C:\Users\rotemSRS\Desktop\automatic_tool_storage\ru_latest.json',
 'en':r'C:\Users\rotemSRS\Desktop\automatic_tool_storage\en_latest.json',
 }
-records, msg = compare_records_from_sources(
-    source_paths=source_paths,
-    include_en_keys=False,
-    module_col='Main Modulew',
-    english_col='English',
-    korean_col='Korean',
-    russian_col='Russian',
-)
-df=pd.DataFrame(records)
-print(df.loc[df['Dictionary English']=='Car',['Dictionary Korean','ko.json','KO_Match']].to_string(index=False))
+
+
+def main():
+    # app 모듈은 streamlit까지 끌어오므로 경로 구성 후에 import
+    from app import compare_records_from_sources
+    from app_modules.storage_utils import memoize_compare
+
+    # 같은 입력/코드로 다시 실행하면 디스크에 캐시된 비교 결과를 재사용
+    df, msg = memoize_compare(compare_records_from_sources)(
+        source_paths=source_paths,
+        include_en_keys=False,
+        module_col='Main Modulew',
+        english_col='English',
+        korean_col='Korean',
+        russian_col='Russian',
+    )
+    by_en = df.drop_duplicates('Dictionary English').set_index('Dictionary English')
+    if 'Car' in by_en.index:
+        print(by_en.loc[['Car'],['Dictionary Korean','ko.json','KO_Match']].to_string(index=False))
+    else:
+        print('Car', 'NOT FOUND')
+
+
+if __name__ == "__main__":
+    main()
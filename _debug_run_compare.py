@@ -1,23 +1,31 @@
-from pathlib import Path
-import pandas as pd
-from app import compare_records_from_sources
-
 source_paths={
     'dictionary': r'C:\Users\rotemSRS\Desktop\automatic_tool_storage\dictionary_latest.xlsx',
     'ko': r'C:\Users\rotemSRS\Desktop\automatic_tool_storage\ko_latest.json',
     'ru': r'C:\Users\rotemSRS\Desktop\automatic_tool_storage\ru_latest.json',
     'en': r'C:\Users\rotemSRS\Desktop\automatic_tool_storage\en_latest.json',
 }
-records, msg = compare_records_from_sources(
-    source_paths=source_paths,
-    include_en_keys=False,
-    module_col='Main Modulew',
-    english_col='English',
-    korean_col='Korean',
-    russian_col='Russian',
-)
-print(msg)
-if records:
-    df=pd.DataFrame(records)
-    print(df[['Dictionary English','en.json','ko.json','ru.json','EN_Match','KO_Match','RU_Match']].head(15).to_string(index=False))
-    print('non-empty', (df['en.json'].astype(str).str.strip()!='').sum(), (df['ko.json'].astype(str).str.strip()!='').sum(), (df['ru.json'].astype(str).str.strip()!='').sum())
+
+
+def main():
+    # app 모듈은 streamlit까지 끌어오므로 경로 구성 후에 import
+    from app import compare_records_from_sources
+    from app_modules.storage_utils import memoize_compare
+    from app_modules.text_utils import nonempty_count
+
+    # 같은 입력/코드로 다시 실행하면 디스크에 캐시된 비교 결과를 재사용
+    df, msg = memoize_compare(compare_records_from_sources)(
+        source_paths=source_paths,
+        include_en_keys=False,
+        module_col='Main Modulew',
+        english_col='English',
+        korean_col='Korean',
+        russian_col='Russian',
+    )
+    print(msg)
+    if not df.empty:
+        print(df[['Dictionary English','en.json','ko.json','ru.json','EN_Match','KO_Match','RU_Match']].head(15).to_string(index=False))
+        print('non-empty', nonempty_count(df['en.json']), nonempty_count(df['ko.json']), nonempty_count(df['ru.json']))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,9 +3,11 @@ from __future__ import annotations
 import hashlib
 import json
 import math
-from io import StringIO
+from functools import lru_cache, partial
+from io import BytesIO
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
@@ -13,136 +15,171 @@ from app_modules.compare_logic import (
     build_compare_dataframe,
     guess_mapping_columns,
     read_dictionary,
-    read_json_map,
+    read_json_maps,
 )
-from app_modules.exporters import dataframe_to_excel_bytes
-from app_modules.matching_utils import recompute_match_columns
-from app_modules.storage_utils import get_saved_file_path, resolve_storage_dir, set_storage_dir
-from app_modules.text_utils import normalize_text
+from app_modules.exporters import dataframe_to_csv_bytes, dataframe_to_excel_bytes
+from app_modules.matching_utils import categorize_match_columns, recompute_match_columns
+from app_modules.storage_utils import get_saved_file_paths, resolve_storage_dir, set_storage_dir
+from app_modules.text_utils import has_nonempty, normalize_series, normalize_series_list, normalize_text
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
 
 
 APP_TITLE = "번역 정합성 검증 도구"
 MATCH_COLUMNS = ["KO_Match", "EN_Match", "RU_Match", "Overall_Match"]
+# 소스 키 -> 저장 별칭
+SOURCE_ALIASES = {
+    "dictionary": "dictionary_latest",
+    "ko": "ko_latest",
+    "ru": "ru_latest",
+    "en": "en_latest",
+}
 CHANGE_COL_NAME = "변경컬럼"
 OLD_VALUE_COL = "이전값"
 NEW_VALUE_COL = "수정값"
+DIFF_SKIP_COLUMNS = frozenset({"순번", "수정상태"})
 
 
 def _to_bool_flag(v) -> bool:
     return str(v).strip().lower() in {"1", "true", "on", "yes", "y"}
 
 
+def _streamlit_version() -> tuple[int, ...]:
+    parts = []
+    for part in str(getattr(st, "__version__", "0")).split(".")[:2]:
+        digits = "".join(ch for ch in part if ch.isdigit())
+        parts.append(int(digits or 0))
+    return tuple(parts)
+
+
+# st.download_button(data=callable)은 Streamlit 1.52부터 지원 (이전 버전은 바이트를 미리 생성)
+LAZY_DOWNLOAD_SUPPORTED = _streamlit_version() >= (1, 52)
+
+
+# 공통 CSS는 모듈 로드 시 한 번만 공백을 정리해 두고 rerun마다 같은 문자열을 재사용
+TABLE_WRAP_CSS = " ".join(
+    line.strip()
+    for line in """
+    <style>
+    .block-container {
+        padding-top: 0.8rem !important;
+        padding-bottom: 1rem !important;
+    }
+    header[data-testid="stHeader"] {
+        display: none !important;
+    }
+    div[data-testid="stAppViewContainer"] {
+        margin-top: 0 !important;
+    }
+    .app-title {
+        font-size: clamp(1.4rem, 2.2vw, 2.05rem);
+        line-height: 1.2;
+        font-weight: 700;
+        margin: 0 0 0.35rem 0;
+        white-space: normal;
+        overflow-wrap: anywhere;
+        word-break: break-word;
+    }
+    h1, h2, h3 {
+        letter-spacing: -0.01em;
+    }
+    .qa-toolbar {
+        border: 1px solid #e5e7eb;
+        border-radius: 12px;
+        padding: 6px 10px 0 10px;
+        margin-bottom: 6px;
+        background: #fafafa;
+    }
+    .qa-section-title {
+        font-size: 0.86rem;
+        font-weight: 700;
+        margin: 1px 0 4px 0;
+        color: #334155;
+    }
+    .stButton > button {
+        border-radius: 10px !important;
+        border: 1px solid #d1d5db !important;
+        padding-top: 0.2rem !important;
+        padding-bottom: 0.2rem !important;
+        min-height: 2rem !important;
+    }
+    .pagination-row .stButton > button {
+        border-radius: 8px !important;
+        min-height: 1.85rem !important;
+        height: 1.85rem !important;
+        padding: 0 0.5rem !important;
+        font-size: 0.76rem !important;
+        line-height: 1 !important;
+        border: 1px solid #cbd5e1 !important;
+        background: #fff !important;
+    }
+    .pagination-row [data-testid="column"] {
+        padding-left: 0.06rem !important;
+        padding-right: 0.06rem !important;
+    }
+    .pg-current {
+        display: inline-flex;
+        align-items: center;
+        justify-content: center;
+        min-height: 1.85rem;
+        min-width: 1.85rem;
+        padding: 0 0.5rem;
+        border-radius: 8px;
+        border: 1px solid #0969da;
+        background: #0969da;
+        color: #fff;
+        font-size: 0.76rem;
+        font-weight: 600;
+    }
+    .pg-ellipsis {
+        display: inline-flex;
+        align-items: center;
+        justify-content: center;
+        min-height: 1.85rem;
+        color: #64748b;
+        font-size: 0.78rem;
+    }
+    .stTextInput label, .stSelectbox label, .stMultiSelect label {
+        font-size: 0.78rem !important;
+    }
+    .stTextInput, .stSelectbox, .stMultiSelect {
+        margin-bottom: 0.2rem !important;
+    }
+    div[data-testid="stMetric"] {
+        background: #f8fafc;
+        border: 1px solid #e2e8f0;
+        border-radius: 10px;
+        padding: 6px 8px;
+    }
+    div[data-testid="stVerticalBlock"] > div:has(> div[data-testid="stDataFrame"]) {
+        border-radius: 10px;
+    }
+    div[data-testid="stDataFrame"] [role="gridcell"] {
+        white-space: pre-wrap !important;
+        word-break: break-word !important;
+        line-height: 1.35 !important;
+        align-items: start !important;
+    }
+    div[data-testid="stDataFrame"] [role="columnheader"] {
+        white-space: normal !important;
+        line-height: 1.2 !important;
+    }
+    </style>
+    """.splitlines()
+    if line.strip()
+)
+
+
 def inject_table_wrap_css():
-    st.markdown(
-        """
-        <style>
-        .block-container {
-            padding-top: 0.8rem !important;
-            padding-bottom: 1rem !important;
-        }
-        header[data-testid="stHeader"] {
-            display: none !important;
-        }
-        div[data-testid="stAppViewContainer"] {
-            margin-top: 0 !important;
-        }
-        .app-title {
-            font-size: clamp(1.4rem, 2.2vw, 2.05rem);
-            line-height: 1.2;
-            font-weight: 700;
-            margin: 0 0 0.35rem 0;
-            white-space: normal;
-            overflow-wrap: anywhere;
-            word-break: break-word;
-        }
-        h1, h2, h3 {
-            letter-spacing: -0.01em;
-        }
-        .qa-toolbar {
-            border: 1px solid #e5e7eb;
-            border-radius: 12px;
-            padding: 6px 10px 0 10px;
-            margin-bottom: 6px;
-            background: #fafafa;
-        }
-        .qa-section-title {
-            font-size: 0.86rem;
-            font-weight: 700;
-            margin: 1px 0 4px 0;
-            color: #334155;
-        }
-        .stButton > button {
-            border-radius: 10px !important;
-            border: 1px solid #d1d5db !important;
-            padding-top: 0.2rem !important;
-            padding-bottom: 0.2rem !important;
-            min-height: 2rem !important;
-        }
-        .pagination-row .stButton > button {
-            border-radius: 8px !important;
-            min-height: 1.85rem !important;
-            height: 1.85rem !important;
-            padding: 0 0.5rem !important;
-            font-size: 0.76rem !important;
-            line-height: 1 !important;
-            border: 1px solid #cbd5e1 !important;
-            background: #fff !important;
-        }
-        .pagination-row [data-testid="column"] {
-            padding-left: 0.06rem !important;
-            padding-right: 0.06rem !important;
-        }
-        .pg-current {
-            display: inline-flex;
-            align-items: center;
-            justify-content: center;
-            min-height: 1.85rem;
-            min-width: 1.85rem;
-            padding: 0 0.5rem;
-            border-radius: 8px;
-            border: 1px solid #0969da;
-            background: #0969da;
-            color: #fff;
-            font-size: 0.76rem;
-            font-weight: 600;
-        }
-        .pg-ellipsis {
-            display: inline-flex;
-            align-items: center;
-            justify-content: center;
-            min-height: 1.85rem;
-            color: #64748b;
-            font-size: 0.78rem;
-        }
-        .stTextInput label, .stSelectbox label, .stMultiSelect label {
-            font-size: 0.78rem !important;
-        }
-        .stTextInput, .stSelectbox, .stMultiSelect {
-            margin-bottom: 0.2rem !important;
-        }
-        div[data-testid="stMetric"] {
-            background: #f8fafc;
-            border: 1px solid #e2e8f0;
-            border-radius: 10px;
-            padding: 6px 8px;
-        }
-        div[data-testid="stVerticalBlock"] > div:has(> div[data-testid="stDataFrame"]) {
-            border-radius: 10px;
-        }
-        div[data-testid="stDataFrame"] [role="gridcell"] {
-            white-space: pre-wrap !important;
-            word-break: break-word !important;
-            line-height: 1.35 !important;
-            align-items: start !important;
-        }
-        div[data-testid="stDataFrame"] [role="columnheader"] {
-            white-space: normal !important;
-            line-height: 1.2 !important;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    # rerun에서 호출되지 않은 요소는 화면에서 제거되므로 세션 플래그로 건너뛰지 않음
+    # st.html은 style만 있는 HTML을 마크다운 파싱 없이 레이아웃 밖에 주입
+    if hasattr(st, "html"):
+        st.html(TABLE_WRAP_CSS)
+    else:
+        st.markdown(TABLE_WRAP_CSS, unsafe_allow_html=True)
 
 
 def save_uploaded_file(uploaded, alias: str, storage_dir: Path) -> str:
@@ -154,16 +191,14 @@ def save_uploaded_file(uploaded, alias: str, storage_dir: Path) -> str:
 
 
 def saved_paths_dict(storage_dir: Path) -> dict[str, str]:
-    return {
-        "dictionary": str(get_saved_file_path("dictionary_latest", storage_dir) or ""),
-        "ko": str(get_saved_file_path("ko_latest", storage_dir) or ""),
-        "ru": str(get_saved_file_path("ru_latest", storage_dir) or ""),
-        "en": str(get_saved_file_path("en_latest", storage_dir) or ""),
-    }
+    # 네 별칭을 폴더 한 번 스캔으로 함께 찾음
+    saved = get_saved_file_paths(list(SOURCE_ALIASES.values()), storage_dir)
+    return {key: str(saved[alias] or "") for key, alias in SOURCE_ALIASES.items()}
 
 
 def recompute_matches(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
+    # 컬럼 단위 대입만 하므로 얕은 복사로 충분 (원본 프레임은 변경되지 않음)
+    df = df.copy(deep=False)
     required = [
         "Dictionary Korean",
         "Dictionary English",
@@ -175,7 +210,8 @@ def recompute_matches(df: pd.DataFrame) -> pd.DataFrame:
     for col in required:
         if col not in df.columns:
             df[col] = ""
-        df[col] = df[col].fillna("").apply(normalize_text)
+    for col, values in zip(required, normalize_series_list([df[col] for col in required])):
+        df[col] = values
     return recompute_match_columns(df)
 
 
@@ -188,6 +224,7 @@ def compare_records_from_sources(
     russian_col: str | None,
 ):
     source_paths = dict(source_paths or {})
+    empty_result = pd.DataFrame()
     dictionary_path = Path(source_paths["dictionary"]) if source_paths.get("dictionary") else None
     ko_path = Path(source_paths["ko"]) if source_paths.get("ko") else None
     ru_path = Path(source_paths["ru"]) if source_paths.get("ru") else None
@@ -197,9 +234,10 @@ def compare_records_from_sources(
     ru_loaded = bool(ru_path and ru_path.exists())
     en_loaded = bool(en_path and en_path.exists())
 
-    dictionary_df, _ = read_dictionary(dictionary_path)
+    # 입력 패널/저장 파일 비교에서 이미 읽은 전체 컬럼 프레임과 같은 캐시 키로 조회해 재파싱을 피함
+    dictionary_df, _ = load_dictionary(dictionary_path)
     if dictionary_df is None or dictionary_df.empty:
-        return [], "딕셔너리 파일을 읽지 못했거나 데이터가 비어 있습니다."
+        return empty_result, "딕셔너리 파일을 읽지 못했거나 데이터가 비어 있습니다."
 
     guessed = guess_mapping_columns(dictionary_df)
     module_col = module_col or guessed.get("module")
@@ -209,14 +247,12 @@ def compare_records_from_sources(
 
     required_cols = [module_col, english_col, korean_col, russian_col]
     if any(not c for c in required_cols):
-        return [], "딕셔너리 컬럼 자동 매핑 실패. 컬럼명을 확인하세요."
+        return empty_result, "딕셔너리 컬럼 자동 매핑 실패. 컬럼명을 확인하세요."
     for c in required_cols:
         if c not in dictionary_df.columns:
-            return [], f"선택한 컬럼이 딕셔너리에 없습니다: {c}"
+            return empty_result, f"선택한 컬럼이 딕셔너리에 없습니다: {c}"
 
-    ko_map = read_json_map(ko_path)
-    ru_map = read_json_map(ru_path)
-    en_map = read_json_map(en_path)
+    ko_map, ru_map, en_map = read_json_maps([ko_path, ru_path, en_path])
     out_df, _ = build_compare_dataframe(
         dictionary_df=dictionary_df,
         ko_map=ko_map,
@@ -236,9 +272,9 @@ def compare_records_from_sources(
     if not ru_loaded:
         out_df["ru.json"] = ""
 
-    ko_has_data = out_df["ko.json"].astype(str).str.strip().ne("").any()
-    en_has_data = out_df["en.json"].astype(str).str.strip().ne("").any()
-    ru_has_data = out_df["ru.json"].astype(str).str.strip().ne("").any()
+    ko_has_data = has_nonempty(out_df["ko.json"])
+    en_has_data = has_nonempty(out_df["en.json"])
+    ru_has_data = has_nonempty(out_df["ru.json"])
     if not ko_has_data:
         out_df["ko.json"] = ""
     if not en_has_data:
@@ -253,7 +289,7 @@ def compare_records_from_sources(
         f"ru.json={'로드됨' if ru_loaded else '없음'}{'(데이터없음)' if ru_loaded and not ru_has_data else ''}, "
         f"en.json={'로드됨' if en_loaded else '없음'}{'(데이터없음)' if en_loaded and not en_has_data else ''}"
     )
-    return out_df.to_dict("records"), status
+    return out_df, status
 
 
 def init_state():
@@ -261,8 +297,10 @@ def init_state():
     fullscreen_from_query = _to_bool_flag(st.query_params.get("fullscreen", "0"))
     st.session_state.setdefault("storage_dir", str(storage_dir))
     st.session_state.setdefault("storage_dir_input", str(storage_dir))
-    st.session_state.setdefault("source_paths", saved_paths_dict(storage_dir))
-    st.session_state.setdefault("result_records", [])
+    # setdefault 인자는 rerun마다 평가되므로 저장 폴더 스캔은 세션 첫 실행에서만 수행
+    if "source_paths" not in st.session_state:
+        st.session_state["source_paths"] = saved_paths_dict(storage_dir)
+    st.session_state.setdefault("result_df", pd.DataFrame())
     st.session_state.setdefault("compare_status", "대기 중")
     st.session_state.setdefault("hidden_columns", [])
     st.session_state.setdefault("global_search", "")
@@ -271,29 +309,63 @@ def init_state():
     st.session_state.setdefault("show_input_in_fullscreen", False)
     st.session_state.setdefault("did_initial_autorun", False)
     st.session_state.setdefault("edit_mode", False)
-    st.session_state.setdefault("pre_edit_records", [])
+    st.session_state.setdefault("pre_edit_df", None)
+    st.session_state.setdefault("pre_edit_fingerprint", "")
     st.session_state.setdefault("pending_edit_bundle", None)
     st.session_state.setdefault("focus_compare_key", "")
     st.session_state.setdefault("edited_language_marks", {})
 
 
-@st.cache_data(show_spinner=False)
-def dataframe_to_excel_bytes_cached(df_json: str) -> bytes:
-    df = pd.read_json(StringIO(df_json), orient="split").fillna("")
-    return dataframe_to_excel_bytes(df)
+def dataframe_fingerprint(df: pd.DataFrame) -> str:
+    # 내보내기 캐시 키: 컬럼 구성 + 행 단위 해시(JSON 직렬화 없이 내용 변경 감지)
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    digest = hashlib.sha1(row_hashes.tobytes())
+    digest.update(json.dumps([str(c) for c in df.columns], ensure_ascii=False).encode("utf-8"))
+    return f"{len(df)}:{digest.hexdigest()}"
+
+
+# _df 인자는 Streamlit 캐시 해싱에서 제외되고 fingerprint만 키로 사용됨
+@st.cache_data(show_spinner=False, max_entries=4)
+def dataframe_to_excel_bytes_cached(_df: pd.DataFrame, fingerprint: str) -> bytes:
+    return dataframe_to_excel_bytes(_df.fillna(""))
+
 
+@st.cache_data(show_spinner=False, max_entries=4)
+def dataframe_to_csv_bytes_cached(_df: pd.DataFrame, fingerprint: str) -> bytes:
+    return dataframe_to_csv_bytes(_df)
 
-@st.cache_data(show_spinner=False)
-def dataframe_to_csv_bytes_cached(df_json: str) -> bytes:
-    df = pd.read_json(StringIO(df_json), orient="split").fillna("")
-    return df.to_csv(index=False).encode("utf-8-sig")
+
+# 경로 + mtime + 크기를 키로 사용해 같은 파일이면 rerun마다 다시 파싱하지 않음
+@st.cache_data(show_spinner=False, max_entries=4)
+def read_dictionary_cached(path: str, mtime_ns: int, size: int):
+    return read_dictionary(Path(path))
+
+
+# 같은 기준 파일을 다시 비교할 때는 업로드 바이트 해시로 캐시된 파싱 결과를 재사용
+@st.cache_data(show_spinner=False, max_entries=4)
+def read_baseline_table(raw: bytes, file_name: str) -> pd.DataFrame:
+    if file_name.lower().endswith(".xlsx"):
+        return pd.read_excel(BytesIO(raw), dtype=str).fillna("")
+    return pd.read_csv(BytesIO(raw), dtype=str, keep_default_na=False).fillna("")
+
+
+def load_dictionary(dictionary_path: Path | None):
+    if dictionary_path is None:
+        return None, None
+    # exists()+stat() 대신 stat 한 번으로 존재 확인과 캐시 키를 함께 얻음
+    try:
+        stat = dictionary_path.stat()
+    except OSError:
+        return None, None
+    return read_dictionary_cached(str(dictionary_path), stat.st_mtime_ns, stat.st_size)
 
 
 def upload_sig(uploaded) -> str:
     if uploaded is None:
         return ""
     payload = uploaded.getvalue()
-    digest = hashlib.md5(payload).hexdigest()
+    # 변경 감지용이므로 암호 해시 대신 xxh3(없으면 md5) 사용
+    digest = xxhash.xxh3_64_hexdigest(payload) if xxhash is not None else hashlib.md5(payload).hexdigest()
     return f"{uploaded.name}:{uploaded.size}:{digest}"
 
 
@@ -338,68 +410,85 @@ def diff_report(baseline_df: pd.DataFrame, current_df: pd.DataFrame) -> pd.DataF
     if key_col not in current_df.columns or baseline_key_col not in baseline_df.columns:
         return pd.DataFrame([{"오류": "기준 파일/현재 데이터에 키 컬럼(비교 Key 또는 Dictionary English)이 필요합니다."}])
 
-    baseline_map = {
-        normalize_text(r[baseline_key_col]): {k: normalize_text(v) for k, v in r.items()}
-        for r in baseline_df.to_dict("records")
-        if normalize_text(r.get(baseline_key_col, ""))
-    }
-    current_map = {
-        normalize_text(r[key_col]): {k: normalize_text(v) for k, v in r.items()}
-        for r in current_df.to_dict("records")
-        if normalize_text(r.get(key_col, ""))
-    }
+    # 키별 정규화 값 테이블을 만든 뒤 공통 키는 numpy 비교 마스크로 변경 셀을 한 번에 추출
+    def keyed_values(frame: pd.DataFrame, key_column: str) -> pd.DataFrame:
+        # 반복 값이 많으므로 고유값 단위 정규화(normalize_series)로 처리
+        keys = pd.Series(normalize_series(frame[key_column]).to_numpy(dtype=object), index=frame.index)
+        keep = (keys != "") & ~keys.duplicated(keep="last")
+        kept = frame.loc[keep]
+        values = pd.DataFrame(
+            {col: normalize_series(normalize_series(kept[col])).to_numpy(dtype=object) for col in frame.columns},
+            index=pd.Index(keys[keep].tolist(), dtype=object),
+        )
+        return values
+
+    before = keyed_values(baseline_df, baseline_key_col)
+    after = keyed_values(current_df, key_col)
+    compare_cols = [c for c in sorted(set(before.columns) | set(after.columns)) if c not in DIFF_SKIP_COLUMNS]
+
+    common_keys = before.index.intersection(after.index)
+    before_values = before.reindex(index=common_keys, columns=compare_cols, fill_value="").to_numpy(dtype=object)
+    after_values = after.reindex(index=common_keys, columns=compare_cols, fill_value="").to_numpy(dtype=object)
+    row_idx, col_idx = np.nonzero(before_values != after_values)
+    changed = pd.DataFrame(
+        {
+            "비교 Key": common_keys.to_numpy(dtype=object)[row_idx],
+            "변경유형": "변경",
+            "변경컬럼": [compare_cols[i] for i in col_idx],
+            "이전값": before_values[row_idx, col_idx],
+            "현재값": after_values[row_idx, col_idx],
+        }
+    )
+    # 추가/삭제 키는 최종 결과에서 키 기준으로 한 번만 정렬하므로 차집합 단계의 정렬은 생략
+    added_keys = after.index.difference(before.index, sort=False).tolist()
+    added = pd.DataFrame({"비교 Key": added_keys, "변경유형": "추가", "변경컬럼": "-", "이전값": "", "현재값": "행 추가"})
+    removed_keys = before.index.difference(after.index, sort=False).tolist()
+    removed = pd.DataFrame({"비교 Key": removed_keys, "변경유형": "삭제", "변경컬럼": "-", "이전값": "행 존재", "현재값": ""})
 
-    all_keys = sorted(set(baseline_map.keys()) | set(current_map.keys()))
-    rows = []
-    for key in all_keys:
-        before = baseline_map.get(key)
-        after = current_map.get(key)
-        if before is None and after is not None:
-            rows.append({"비교 Key": key, "변경유형": "추가", "변경컬럼": "-", "이전값": "", "현재값": "행 추가"})
-            continue
-        if before is not None and after is None:
-            rows.append({"비교 Key": key, "변경유형": "삭제", "변경컬럼": "-", "이전값": "행 존재", "현재값": ""})
-            continue
-        cols = sorted(set(before.keys()) | set(after.keys()))
-        for col in cols:
-            if col in ["순번", "수정상태"]:
-                continue
-            b = normalize_text(before.get(col, ""))
-            a = normalize_text(after.get(col, ""))
-            if b != a:
-                rows.append({"비교 Key": key, "변경유형": "변경", "변경컬럼": col, "이전값": b, "현재값": a})
-    return pd.DataFrame(rows)
+    report = pd.concat([changed, added, removed], ignore_index=True)
+    return report.sort_values(by=["비교 Key"], kind="stable").reset_index(drop=True)
 
 
 def style_match_highlight(df: pd.DataFrame, focus_key: str = "", edited_language_marks: dict[str, list[str]] | None = None) -> pd.io.formats.style.Styler:
     edited_language_marks = edited_language_marks or {}
+    border_targets = {
+        "KO": ("KO_Match", ["Dictionary Korean", "ko.json"]),
+        "EN": ("EN_Match", ["Dictionary English", "en.json"]),
+        "RU": ("RU_Match", ["Dictionary Russian", "ru.json"]),
+    }
 
-    def style_row(row: pd.Series):
-        styles = []
-        ko_n = str(row.get("KO_Match", "")).strip() == "N"
-        en_n = str(row.get("EN_Match", "")).strip() == "N"
-        ru_n = str(row.get("RU_Match", "")).strip() == "N"
-        row_key = normalize_text(row.get("비교 Key", ""))
-        row_marks = set(edited_language_marks.get(row_key, []))
-        is_focus = normalize_text(row.get("비교 Key", "")) == normalize_text(focus_key)
-        for col, val in row.items():
-            cell_styles = []
-            if col in MATCH_COLUMNS and str(val).strip() == "N":
-                cell_styles.append("background-color: #fff59d; font-weight: 700;")
-            # 빨간 테두리 조건: mismatch(N) + 사용자 수정 언어
-            if col in ["Dictionary Korean", "ko.json"] and "KO" in row_marks and ko_n:
-                cell_styles.append("border: 1px solid red;")
-            if col in ["Dictionary English", "en.json"] and "EN" in row_marks and en_n:
-                cell_styles.append("border: 1px solid red;")
-            if col in ["Dictionary Russian", "ru.json"] and "RU" in row_marks and ru_n:
-                cell_styles.append("border: 1px solid red;")
-            # 포커스 행은 가벼운 표시만 유지
-            if is_focus and col == "비교 Key":
-                cell_styles.append("font-weight: 700;")
-            styles.append("; ".join(cell_styles))
-        return styles
-
-    return df.style.apply(style_row, axis=1)
+    def style_frame(frame: pd.DataFrame) -> pd.DataFrame:
+        # 행 단위 콜백 대신 컬럼별 불리언 마스크로 전체 스타일 배열을 한 번에 채움
+        styles = np.full(frame.shape, "", dtype=object)
+        if "비교 Key" in frame.columns:
+            row_keys = frame["비교 Key"].map(normalize_text)
+        else:
+            row_keys = pd.Series("", index=frame.index)
+
+        def n_mask(col: str) -> np.ndarray:
+            if col not in frame.columns:
+                return np.zeros(len(frame.index), dtype=bool)
+            return frame[col].astype(str).str.strip().eq("N").fillna(False).to_numpy(dtype=bool)
+
+        for col in MATCH_COLUMNS:
+            if col in frame.columns:
+                styles[n_mask(col), frame.columns.get_loc(col)] = "background-color: #fff59d; font-weight: 700;"
+        # 빨간 테두리 조건: mismatch(N) + 사용자 수정 언어
+        for lang, (match_col, target_cols) in border_targets.items():
+            marked_keys = {key for key, langs in edited_language_marks.items() if lang in langs}
+            if not marked_keys:
+                continue
+            border_mask = n_mask(match_col) & row_keys.isin(marked_keys).to_numpy(dtype=bool)
+            for col in target_cols:
+                if col in frame.columns:
+                    styles[border_mask, frame.columns.get_loc(col)] = "border: 1px solid red;"
+        # 포커스 행은 가벼운 표시만 유지
+        if "비교 Key" in frame.columns:
+            focus_mask = row_keys.eq(normalize_text(focus_key)).to_numpy(dtype=bool)
+            styles[focus_mask, frame.columns.get_loc("비교 Key")] = "font-weight: 700;"
+        return pd.DataFrame(styles, index=frame.index, columns=frame.columns)
+
+    return df.style.apply(style_frame, axis=None)
 
 
 def build_edited_language_marks(change_df: pd.DataFrame) -> dict[str, list[str]]:
@@ -414,15 +503,12 @@ def build_edited_language_marks(change_df: pd.DataFrame) -> dict[str, list[str]]
         "Dictionary Russian": "RU",
         "ru.json": "RU",
     }
-    marks: dict[str, set[str]] = {}
-    for row in change_df.to_dict("records"):
-        key = normalize_text(row.get("비교 Key", ""))
-        col = normalize_text(row.get(CHANGE_COL_NAME, ""))
-        lang = col_to_lang.get(col)
-        if not key or not lang:
-            continue
-        marks.setdefault(key, set()).add(lang)
-    return {k: sorted(list(v)) for k, v in marks.items()}
+    keys = change_df["비교 Key"].map(normalize_text)
+    langs = change_df[CHANGE_COL_NAME].map(normalize_text).map(col_to_lang)
+    valid = (keys != "") & langs.notna()
+    # 키 첫 등장 순서를 유지한 채 키별 수정 언어를 모음
+    grouped = langs[valid].groupby(keys[valid], sort=False).unique()
+    return {k: sorted(v) for k, v in grouped.items()}
 
 
 def apply_value_filters(df: pd.DataFrame, visible_cols: list[str]) -> pd.DataFrame:
@@ -442,9 +528,11 @@ def apply_value_filters(df: pd.DataFrame, visible_cols: list[str]) -> pd.DataFra
             key="value_filter_cols",
             help="빠른 매치 필터(KO/EN/RU/ALL) 외에 필요한 열만 추가로 필터링합니다.",
         )
-        filtered = df.copy()
+        # 열마다 프레임을 자르지 않고 불리언 마스크만 누적한 뒤 마지막에 한 번만 슬라이스
+        keep = np.ones(len(df.index), dtype=bool)
         for col in filter_cols:
-            options = sorted({str(v) for v in filtered[col].fillna("").tolist()})
+            values = df[col].fillna("").astype(str)
+            options = sorted(values[keep].unique().tolist())
             selected = st.multiselect(
                 f"{col}",
                 options=options,
@@ -452,31 +540,75 @@ def apply_value_filters(df: pd.DataFrame, visible_cols: list[str]) -> pd.DataFra
                 key=f"value_filter_{col}",
             )
             if selected:
-                filtered = filtered[filtered[col].astype(str).isin(selected)]
-        return filtered
+                keep &= df[col].astype(str).isin(selected).to_numpy(dtype=bool)
+        if keep.all():
+            return df
+        return df[keep]
 
 def apply_seq_sort(df: pd.DataFrame, ascending: bool) -> pd.DataFrame:
     if "순번" not in df.columns:
         return df
-    sorted_df = df.copy()
-    seq_numeric = pd.to_numeric(sorted_df["순번"], errors="coerce")
-    sorted_df["_seq_sort"] = seq_numeric
-    sorted_df = sorted_df.sort_values(by=["_seq_sort"], ascending=[ascending], kind="stable").drop(columns=["_seq_sort"])
-    return sorted_df
-
-
-def apply_match_quick_filters(df: pd.DataFrame, ko: str, en: str, ru: str, overall: str) -> pd.DataFrame:
-    filtered = df.copy()
+    # 정렬 키만 따로 정렬해 위치 순서로 재배열 (임시 컬럼 추가용 전체 복사 없음)
+    seq_numeric = pd.to_numeric(df["순번"], errors="coerce").reset_index(drop=True)
+    order = seq_numeric.sort_values(ascending=ascending, kind="stable").index
+    return df.iloc[order]
+
+
+def global_search_mask(df: pd.DataFrame, visible_cols: list[str], query: str) -> np.ndarray:
+    qs = query.strip().lower()
+    if not qs:
+        return np.ones(len(df.index), dtype=bool)
+    search_cols = [c for c in visible_cols if c in df.columns]
+    if not search_cols:
+        return np.zeros(len(df.index), dtype=bool)
+    # 표시 컬럼을 구분자로 이어 붙여 대소문자 무시 부분 문자열 검색을 한 번에 수행 (별도 lower 패스 없음)
+    texts = [df[col].astype(str) for col in search_cols]
+    joined = texts[0].str.cat(texts[1:], sep="\x1f", na_rep="") if len(texts) > 1 else texts[0]
+    return joined.str.contains(qs, case=False, regex=False, na=False).to_numpy(dtype=bool)
+
+
+def match_quick_filter_mask(df: pd.DataFrame, ko: str, en: str, ru: str, overall: str) -> np.ndarray:
     cond = {
         "KO_Match": ko,
         "EN_Match": en,
         "RU_Match": ru,
         "Overall_Match": overall,
     }
+    # 범주형 컬럼은 코드 비교
+    keep = np.ones(len(df.index), dtype=bool)
     for col, val in cond.items():
-        if col in filtered.columns and val != "전체":
-            filtered = filtered[filtered[col].astype(str) == val]
-    return filtered
+        if col in df.columns and val != "전체":
+            keep &= match_column_equals(df[col], val)
+    return keep
+
+
+def apply_search_and_match_filters(
+    df: pd.DataFrame, visible_cols: list[str], query: str, ko: str, en: str, ru: str, overall: str
+) -> pd.DataFrame:
+    # 검색/빠른 필터 마스크를 합쳐 중간 프레임 없이 한 번만 슬라이스
+    keep = global_search_mask(df, visible_cols, query) & match_quick_filter_mask(df, ko, en, ru, overall)
+    if keep.all():
+        return df
+    return df[keep]
+
+
+# 수정 전 기준 테이블은 스냅샷이 바뀌지 않는 한 같은 조건이면 결과가 같으므로 지문+조건으로 캐시
+@st.cache_data(show_spinner=False, max_entries=32)
+def filter_sort_slice_cached(
+    _df: pd.DataFrame,
+    fingerprint: str,
+    visible_cols: tuple[str, ...],
+    query: str,
+    ko: str,
+    en: str,
+    ru: str,
+    overall: str,
+    ascending: bool,
+    start: int,
+    end: int,
+) -> pd.DataFrame:
+    filtered = apply_search_and_match_filters(_df, list(visible_cols), query, ko, en, ru, overall)
+    return apply_seq_sort(filtered, ascending=ascending).iloc[start:end]
 
 
 def get_pagination_state(total_count: int, key_prefix: str) -> tuple[int, int, int]:
@@ -489,22 +621,21 @@ def get_pagination_state(total_count: int, key_prefix: str) -> tuple[int, int, i
     return current, page_size, total_pages
 
 
-def build_github_like_pages(total_pages: int, current: int) -> list[int | None]:
+# (전체 페이지, 현재 페이지)별 결과가 고정이므로 캐시하고, 집합/정렬 없이 순서대로 구성
+@lru_cache(maxsize=1024)
+def build_github_like_pages(total_pages: int, current: int) -> tuple[int | None, ...]:
     if total_pages <= 7:
-        return list(range(1, total_pages + 1))
-
-    pages = {1, total_pages, current - 1, current, current + 1}
-    pages = {p for p in pages if 1 <= p <= total_pages}
-    ordered = sorted(pages)
+        return tuple(range(1, total_pages + 1))
 
-    items: list[int | None] = []
-    prev = None
-    for p in ordered:
-        if prev is not None and p - prev > 1:
-            items.append(None)
-        items.append(p)
-        prev = p
-    return items
+    middle = list(range(max(2, current - 1), min(total_pages - 1, current + 1) + 1))
+    items: list[int | None] = [1]
+    if not middle or middle[0] > 2:
+        items.append(None)
+    items.extend(middle)
+    if middle and middle[-1] < total_pages - 1:
+        items.append(None)
+    items.append(total_pages)
+    return tuple(items)
 
 
 def render_numeric_pagination_controls(total_count: int, current: int, total_pages: int, key_prefix: str):
@@ -543,16 +674,21 @@ def render_numeric_pagination_controls(total_count: int, current: int, total_pag
         st.markdown("</div>", unsafe_allow_html=True)
 
 
+# 결과 프레임은 세션에 넣을 때 한 번만 결측값 정리 + 매치 컬럼 범주형 변환 (rerun마다 반복하지 않음)
+def prepare_result_df(df: pd.DataFrame) -> pd.DataFrame:
+    return categorize_match_columns(df.fillna(""), MATCH_COLUMNS)
+
+
 def run_compare_from_saved_files(include_en_keys: bool = False):
     source_paths = st.session_state.get("source_paths", {})
     dictionary_path = Path(source_paths.get("dictionary", "")) if source_paths.get("dictionary") else None
-    dictionary_df, _ = read_dictionary(dictionary_path)
+    dictionary_df, _ = load_dictionary(dictionary_path)
     if dictionary_df is None or dictionary_df.empty:
         st.session_state["compare_status"] = "비교 실패: 딕셔너리 파일이 없거나 비어 있습니다."
         return
 
     mapping = guess_mapping_columns(dictionary_df)
-    records, status = compare_records_from_sources(
+    result_df, status = compare_records_from_sources(
         source_paths,
         include_en_keys=include_en_keys,
         module_col=mapping.get("module"),
@@ -560,9 +696,9 @@ def run_compare_from_saved_files(include_en_keys: bool = False):
         korean_col=mapping.get("korean"),
         russian_col=mapping.get("russian"),
     )
-    st.session_state["result_records"] = records
+    st.session_state["result_df"] = prepare_result_df(result_df)
     st.session_state["compare_status"] = status
-    st.session_state["pre_edit_records"] = []
+    st.session_state["pre_edit_df"] = None
     st.session_state["pending_edit_bundle"] = None
     st.session_state["edit_mode"] = False
     st.session_state["focus_compare_key"] = ""
@@ -570,24 +706,35 @@ def run_compare_from_saved_files(include_en_keys: bool = False):
 
 
 def build_change_preview(before_df: pd.DataFrame, edited_df: pd.DataFrame, visible_cols: list[str]) -> pd.DataFrame:
-    rows = []
-    for idx in edited_df.index:
-        for col in visible_cols:
-            before_val = normalize_text(before_df.at[idx, col]) if col in before_df.columns else ""
-            after_val = normalize_text(edited_df.at[idx, col]) if col in edited_df.columns else ""
-            if before_val != after_val:
-                seq_val = before_df.at[idx, "순번"] if "순번" in before_df.columns else ""
-                key_val = before_df.at[idx, "비교 Key"] if "비교 Key" in before_df.columns else ""
-                rows.append(
-                    {
-                        "순번": seq_val,
-                        "비교 Key": key_val,
-                        CHANGE_COL_NAME: col,
-                        OLD_VALUE_COL: before_val,
-                        NEW_VALUE_COL: after_val,
-                    }
-                )
-    return pd.DataFrame(rows)
+    # 표시 컬럼을 정규화한 2차원 배열끼리 한 번에 비교하고 변경 좌표만 추출
+    before_rows = before_df.loc[edited_df.index]
+    row_count = len(edited_df.index)
+
+    def normalized_matrix(frame: pd.DataFrame) -> np.ndarray:
+        matrix = np.full((row_count, len(visible_cols)), "", dtype=object)
+        for pos, col in enumerate(visible_cols):
+            if col in frame.columns:
+                matrix[:, pos] = frame[col].map(normalize_text).to_numpy(dtype=object)
+        return matrix
+
+    before_values = normalized_matrix(before_rows)
+    after_values = normalized_matrix(edited_df)
+    row_idx, col_idx = np.nonzero(before_values != after_values)
+
+    def row_values(col: str) -> np.ndarray:
+        if col not in before_rows.columns:
+            return np.full(len(row_idx), "", dtype=object)
+        return before_rows[col].to_numpy(dtype=object)[row_idx]
+
+    return pd.DataFrame(
+        {
+            "순번": row_values("순번"),
+            "비교 Key": row_values("비교 Key"),
+            CHANGE_COL_NAME: [visible_cols[i] for i in col_idx],
+            OLD_VALUE_COL: before_values[row_idx, col_idx],
+            NEW_VALUE_COL: after_values[row_idx, col_idx],
+        }
+    )
 
 
 def normalize_change_preview_columns(change_df: pd.DataFrame) -> pd.DataFrame:
@@ -600,7 +747,7 @@ def normalize_change_preview_columns(change_df: pd.DataFrame) -> pd.DataFrame:
         "현재값": NEW_VALUE_COL,
         "수정 값": NEW_VALUE_COL,
     }
-    normalized = change_df.rename(columns={k: v for k, v in rename_map.items() if k in change_df.columns}).copy()
+    normalized = change_df.rename(columns={k: v for k, v in rename_map.items() if k in change_df.columns})
     for col in ["순번", "비교 Key", CHANGE_COL_NAME, OLD_VALUE_COL, NEW_VALUE_COL]:
         if col not in normalized.columns:
             normalized[col] = ""
@@ -642,13 +789,26 @@ def run_internal_sanity_checks_once():
     st.session_state["_sanity_checked"] = True
 
 
+def match_column_equals(series: pd.Series, value: str) -> np.ndarray:
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        if value not in series.cat.categories:
+            return np.zeros(len(series.index), dtype=bool)
+        return series.cat.codes.to_numpy() == series.cat.categories.get_loc(value)
+    return series.eq(value).fillna(False).to_numpy(dtype=bool)
+
+
+def count_match_state(df: pd.DataFrame, col: str, value: str = "N") -> int:
+    if col not in df.columns:
+        return 0
+    return int(match_column_equals(df[col], value).sum())
+
+
 def mismatch_counts(df: pd.DataFrame) -> dict[str, int]:
-    frame = df.fillna("")
     return {
-        "KO": int((frame.get("KO_Match", pd.Series(dtype=str)).astype(str) == "N").sum()),
-        "EN": int((frame.get("EN_Match", pd.Series(dtype=str)).astype(str) == "N").sum()),
-        "RU": int((frame.get("RU_Match", pd.Series(dtype=str)).astype(str) == "N").sum()),
-        "ALL": int((frame.get("Overall_Match", pd.Series(dtype=str)).astype(str) == "N").sum()),
+        "KO": count_match_state(df, "KO_Match"),
+        "EN": count_match_state(df, "EN_Match"),
+        "RU": count_match_state(df, "RU_Match"),
+        "ALL": count_match_state(df, "Overall_Match"),
     }
 
 
@@ -669,7 +829,7 @@ def render_input_panel(storage_dir: Path):
             st.session_state["storage_dir"] = str(new_dir)
             st.session_state["storage_dir_input"] = str(new_dir)
             st.session_state["source_paths"] = saved_paths_dict(new_dir)
-            st.session_state["result_records"] = []
+            st.session_state["result_df"] = pd.DataFrame()
             st.session_state["compare_status"] = f"저장 폴더 변경 완료: {new_dir}"
             st.session_state["did_initial_autorun"] = False
             st.session_state["edited_language_marks"] = {}
@@ -690,10 +850,8 @@ def render_input_panel(storage_dir: Path):
         en_up = st.file_uploader("en.json 업로드(선택)", type=["json"], key="up_en")
 
     before = dict(st.session_state["source_paths"])
-    apply_upload_and_reload(dict_up, "dictionary_latest", "dictionary", storage_dir)
-    apply_upload_and_reload(ko_up, "ko_latest", "ko", storage_dir)
-    apply_upload_and_reload(ru_up, "ru_latest", "ru", storage_dir)
-    apply_upload_and_reload(en_up, "en_latest", "en", storage_dir)
+    for key_name, uploaded in (("dictionary", dict_up), ("ko", ko_up), ("ru", ru_up), ("en", en_up)):
+        apply_upload_and_reload(uploaded, SOURCE_ALIASES[key_name], key_name, storage_dir)
     changed = before != st.session_state["source_paths"]
 
     with st.container(border=True):
@@ -701,7 +859,7 @@ def render_input_panel(storage_dir: Path):
         st.dataframe(source_status_rows(st.session_state["source_paths"]), use_container_width=True, height=190)
 
     dictionary_path = Path(st.session_state["source_paths"].get("dictionary", "")) if st.session_state["source_paths"].get("dictionary") else None
-    dictionary_df, _ = read_dictionary(dictionary_path)
+    dictionary_df, _ = load_dictionary(dictionary_path)
     module_col = english_col = korean_col = russian_col = None
     if dictionary_df is not None and not dictionary_df.empty:
         mapping = guess_mapping_columns(dictionary_df)
@@ -717,13 +875,13 @@ def render_input_panel(storage_dir: Path):
         auto_compare
         and not st.session_state["did_initial_autorun"]
         and has_saved_dictionary
-        and not st.session_state["result_records"]
+        and st.session_state["result_df"].empty
     )
     if should_initial_autorun:
         st.session_state["did_initial_autorun"] = True
 
     if (auto_compare and changed) or run_now or should_initial_autorun:
-        records, status = compare_records_from_sources(
+        result_df, status = compare_records_from_sources(
             st.session_state["source_paths"],
             include_en_keys=include_en_keys,
             module_col=module_col,
@@ -731,9 +889,9 @@ def render_input_panel(storage_dir: Path):
             korean_col=korean_col,
             russian_col=russian_col,
         )
-        st.session_state["result_records"] = records
+        st.session_state["result_df"] = prepare_result_df(result_df)
         st.session_state["compare_status"] = status
-        st.session_state["pre_edit_records"] = []
+        st.session_state["pre_edit_df"] = None
         st.session_state["pending_edit_bundle"] = None
         st.session_state["edit_mode"] = False
         st.session_state["focus_compare_key"] = ""
@@ -745,7 +903,8 @@ def render_input_panel(storage_dir: Path):
 def render_result_panel():
     pending = st.session_state.get("pending_edit_bundle")
     st.subheader("결과 검토" if pending else "비교 화면")
-    df = pd.DataFrame(st.session_state["result_records"]).fillna("")
+    # 세션 결과는 저장 시점에 prepare_result_df로 정리되어 있으므로 그대로 사용
+    df = st.session_state["result_df"]
     if df.empty:
         st.info("비교 결과가 없습니다. 파일 업로드 후 비교를 실행하세요.")
         if st.button("저장된 파일로 비교 실행", type="primary", use_container_width=True, key="run_compare_from_saved_in_result"):
@@ -757,8 +916,8 @@ def render_result_panel():
         st.markdown("#### 결과 검토")
         with st.container(border=True):
             st.caption("수정 완료 후 변경 사항을 확인하고 적용 여부를 선택하세요.")
-            edited_df = pd.read_json(StringIO(pending["edited_json"]), orient="split").fillna("")
-            base_df = pd.read_json(StringIO(pending["base_json"]), orient="split").fillna("")
+            edited_df = pending["edited_df"]
+            base_df = pending["base_df"]
             visible = list(pending.get("visible_cols", []))
             merged_preview = base_df.copy()
             for col in visible:
@@ -773,9 +932,7 @@ def render_result_panel():
             d3.metric("RU 불일치", f"{new_counts['RU']:,}", delta=f"{new_counts['RU'] - base_counts['RU']:+d}")
             d4.metric("전체 불일치", f"{new_counts['ALL']:,}", delta=f"{new_counts['ALL'] - base_counts['ALL']:+d}")
 
-            change_preview_df = normalize_change_preview_columns(
-                pd.read_json(StringIO(pending["change_json"]), orient="split").fillna("")
-            )
+            change_preview_df = normalize_change_preview_columns(pending["change_df"].fillna(""))
             st.dataframe(change_preview_df, use_container_width=True, height=360)
             p0, p1, p2, p3 = st.columns([2.4, 1, 1, 1], gap="small")
             with p0:
@@ -785,7 +942,7 @@ def render_result_panel():
                     merged = merged_preview.copy()
                     merged["수정상태"] = merged.get("수정상태", "").astype(str)
                     merged["수정일시"] = merged.get("수정일시", "").astype(str)
-                    st.session_state["result_records"] = merged.to_dict("records")
+                    st.session_state["result_df"] = prepare_result_df(merged)
                     change_marks = build_edited_language_marks(change_preview_df)
                     existing_marks = dict(st.session_state.get("edited_language_marks", {}))
                     for k, langs in change_marks.items():
@@ -845,22 +1002,16 @@ def render_result_panel():
     ascending = sort_order == "오름차순"
 
     st.session_state["global_search"] = q
-    view_df = df.copy()
-    if q.strip():
-        mask = False
-        qs = q.strip().lower()
-        for col in visible_cols:
-            mask = mask | view_df[col].astype(str).str.lower().str.contains(qs, na=False)
-        view_df = view_df[mask]
-    view_df = apply_match_quick_filters(view_df, ko_cond, en_cond, ru_cond, overall_cond)
-    view_df = apply_seq_sort(view_df, ascending=ascending)
-    view_df = apply_value_filters(view_df, visible_cols)
+    # 검색/빠른 필터/정렬 결과는 수정 전 기준 테이블(스냅샷이 없을 때)에서도 그대로 재사용
+    sorted_df = apply_seq_sort(
+        apply_search_and_match_filters(df, visible_cols, q, ko_cond, en_cond, ru_cond, overall_cond),
+        ascending=ascending,
+    )
+    view_df = apply_value_filters(sorted_df, visible_cols)
 
     total_count = len(view_df)
-    ko_n = int((view_df.get("KO_Match", pd.Series(dtype=str)).astype(str) == "N").sum())
-    en_n = int((view_df.get("EN_Match", pd.Series(dtype=str)).astype(str) == "N").sum())
-    ru_n = int((view_df.get("RU_Match", pd.Series(dtype=str)).astype(str) == "N").sum())
-    overall_n = int((view_df.get("Overall_Match", pd.Series(dtype=str)).astype(str) == "N").sum())
+    view_counts = mismatch_counts(view_df)
+    ko_n, en_n, ru_n, overall_n = view_counts["KO"], view_counts["EN"], view_counts["RU"], view_counts["ALL"]
     m1, m2, m3, m4, m5 = st.columns(5)
     m1.metric("전체", f"{total_count:,}")
     m2.metric("KO 불일치", f"{ko_n:,}")
@@ -892,7 +1043,8 @@ def render_result_panel():
                     disabled=edit_mode or bool(pending),
                 ):
                     st.session_state["edit_mode"] = True
-                    st.session_state["pre_edit_records"] = pd.DataFrame(st.session_state["result_records"]).fillna("").to_dict("records")
+                    st.session_state["pre_edit_df"] = st.session_state["result_df"].fillna("")
+                    st.session_state["pre_edit_fingerprint"] = dataframe_fingerprint(st.session_state["pre_edit_df"])
                     st.session_state["pending_edit_bundle"] = None
                     st.rerun()
             with b2:
@@ -914,21 +1066,29 @@ def render_result_panel():
                     st.session_state["pending_edit_bundle"] = None
                     st.rerun()
 
-        editable_view = page_df[visible_cols].copy()
+        editable_view = page_df[visible_cols]
         focus_key = st.session_state.get("focus_compare_key", "")
 
     if edit_mode:
-        edited = st.data_editor(editable_view, use_container_width=True, height=640, key="result_editor")
+        # 순번은 고정값이므로 편집 불가 (nullable Int64라 비우면 fillna("")가 실패함)
+        edited = st.data_editor(
+            editable_view,
+            use_container_width=True,
+            height=640,
+            key="result_editor",
+            disabled=[c for c in ["순번"] if c in editable_view.columns],
+        )
         if finish_clicked:
             change_df = build_change_preview(editable_view, edited.fillna(""), visible_cols)
             if change_df.empty:
                 st.info("변경된 값이 없습니다.")
             else:
+                # 세션 상태는 서버 메모리에 있으므로 직렬화 없이 프레임을 그대로 보관
                 st.session_state["pending_edit_bundle"] = {
-                    "edited_json": edited.fillna("").to_json(orient="split", force_ascii=False),
-                    "base_json": df.to_json(orient="split", force_ascii=False),
+                    "edited_df": edited.fillna(""),
+                    "base_df": df,
                     "visible_cols": visible_cols,
-                    "change_json": change_df.to_json(orient="split", force_ascii=False),
+                    "change_df": change_df,
                 }
                 st.rerun()
     else:
@@ -941,24 +1101,27 @@ def render_result_panel():
         render_numeric_pagination_controls(len(view_df), page_no, page_total, "result")
 
     with st.expander("수정 전 기준 테이블", expanded=False):
-        pre_edit_df = pd.DataFrame(st.session_state.get("pre_edit_records", [])).fillna("")
-        if pre_edit_df.empty:
-            pre_edit_df = df.copy()
-        pre_view_df = pre_edit_df.copy()
-        if q.strip():
-            mask = False
-            qs = q.strip().lower()
-            for col in visible_cols:
-                if col in pre_view_df.columns:
-                    mask = mask | pre_view_df[col].astype(str).str.lower().str.contains(qs, na=False)
-            pre_view_df = pre_view_df[mask]
-        pre_view_df = apply_match_quick_filters(pre_view_df, ko_cond, en_cond, ru_cond, overall_cond)
-        pre_view_df = apply_seq_sort(pre_view_df, ascending=ascending)
-        pre_view_df = pre_view_df.iloc[start:end]
+        pre_edit_df = st.session_state.get("pre_edit_df")
+        if pre_edit_df is None or pre_edit_df.empty:
+            pre_view_df = sorted_df.iloc[start:end]
+        else:
+            pre_view_df = filter_sort_slice_cached(
+                pre_edit_df,
+                st.session_state.get("pre_edit_fingerprint", ""),
+                tuple(visible_cols),
+                q,
+                ko_cond,
+                en_cond,
+                ru_cond,
+                overall_cond,
+                ascending,
+                start,
+                end,
+            )
         if all(c in pre_view_df.columns for c in visible_cols):
             st.dataframe(
                 style_match_highlight(
-                    pre_view_df[visible_cols].copy(),
+                    pre_view_df[visible_cols],
                     focus_key=st.session_state.get("focus_compare_key", ""),
                     edited_language_marks=edited_marks,
                 ),
@@ -968,10 +1131,13 @@ def render_result_panel():
 
     with st.container(border=True):
         st.markdown("#### 내보내기")
-        export_target = view_df.copy()
-        export_json = export_target.to_json(orient="split", force_ascii=False)
-        csv_bytes = dataframe_to_csv_bytes_cached(export_json)
-        excel_bytes = dataframe_to_excel_bytes_cached(export_json)
+        export_fingerprint = dataframe_fingerprint(view_df)
+        # 지원 버전에서는 파일 생성을 렌더링 중이 아니라 다운로드 클릭 시 수행 (같은 지문이면 캐시 재사용)
+        csv_bytes = partial(dataframe_to_csv_bytes_cached, view_df, export_fingerprint)
+        excel_bytes = partial(dataframe_to_excel_bytes_cached, view_df, export_fingerprint)
+        if not LAZY_DOWNLOAD_SUPPORTED:
+            csv_bytes = csv_bytes()
+            excel_bytes = excel_bytes()
         c1, c2 = st.columns(2)
         with c1:
             st.download_button(
@@ -995,11 +1161,8 @@ def render_result_panel():
         baseline = st.file_uploader("기준 파일 업로드(CSV/XLSX)", type=["csv", "xlsx"], key="baseline")
         if baseline is not None and st.button("변경점 비교 실행", use_container_width=True):
             try:
-                if baseline.name.lower().endswith(".xlsx"):
-                    baseline_df = pd.read_excel(baseline, dtype=str).fillna("")
-                else:
-                    baseline_df = pd.read_csv(baseline, dtype=str, keep_default_na=False).fillna("")
-                diff_df = diff_report(baseline_df, pd.DataFrame(st.session_state["result_records"]).fillna(""))
+                baseline_df = read_baseline_table(baseline.getvalue(), baseline.name)
+                diff_df = diff_report(baseline_df, st.session_state["result_df"])
                 st.dataframe(diff_df, use_container_width=True, height=260)
             except Exception as error:
                 st.error(f"기준 파일 처리 실패: {error}")
@@ -1017,7 +1180,7 @@ def main():
     storage_dir = resolve_storage_dir(st.session_state["storage_dir"])
     st.session_state["storage_dir"] = str(storage_dir)
 
-    if not st.session_state["did_initial_autorun"] and not st.session_state["result_records"]:
+    if not st.session_state["did_initial_autorun"] and st.session_state["result_df"].empty:
         st.session_state["source_paths"] = saved_paths_dict(storage_dir)
         if st.session_state["source_paths"].get("dictionary"):
             run_compare_from_saved_files(include_en_keys=False)
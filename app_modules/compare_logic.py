@@ -1,13 +1,66 @@
 import base64
+import importlib.util
 import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
 
+import numpy as np
 import pandas as pd
 
 from app_modules.matching_utils import guess_column, recompute_match_columns, unique_join
-from app_modules.text_utils import canonical_key, normalize_text
+from app_modules.text_utils import TEXT_DTYPE, canonical_key, normalize_series, normalize_text
+
+
+# python-calamine(Rust 기반)이 설치되어 있으면 xlsx 파싱에 우선 사용
+_CALAMINE_AVAILABLE = importlib.util.find_spec("python_calamine") is not None
+
+_TEXT_COLUMNS = ["Dictionary English", "Dictionary Korean", "Dictionary Russian", "en.json", "ko.json", "ru.json"]
+
+# JSON 파서 우선순위: orjson -> pandas 내장 ujson -> 표준 json
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+try:
+    from pandas.io.json import ujson_loads as _ujson_loads
+except ImportError:
+    _ujson_loads = None
+
+
+# 키/번역 문자열은 반복이 많으므로 정규화 결과를 intern해 동일 문자열 비교를 포인터 비교로 단축
+def _normalize_interned(value) -> str:
+    return sys.intern(normalize_text(value))
+
+
+# 딕셔너리 컬럼은 같은 값이 많으므로 고유값만 정규화+intern한 뒤 코드 배열로 펼침
+def _normalize_column_interned(series: pd.Series) -> np.ndarray:
+    codes, uniques = pd.factorize(series, use_na_sentinel=False)
+    normalized = np.array([_normalize_interned(v) for v in uniques], dtype=object)
+    return normalized[codes]
+
+
+def _json_loads(raw: bytes):
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    text = raw.decode("utf-8")
+    if _ujson_loads is not None:
+        return _ujson_loads(text)
+    return json.loads(text)
+
+
+def _read_excel_bytes(raw: bytes, usecols: list[str] | None = None) -> pd.DataFrame:
+    if _CALAMINE_AVAILABLE:
+        try:
+            return pd.read_excel(BytesIO(raw), dtype=str, usecols=usecols, engine="calamine")
+        except (ImportError, ValueError):
+            pass
+    return pd.read_excel(BytesIO(raw), dtype=str, usecols=usecols, engine="openpyxl")
 
 
 def decode_upload_content(content: str | None) -> bytes | None:
@@ -23,7 +76,7 @@ def read_uploaded_table(content: str | None, filename: str | None):
         return None
     name = filename.lower()
     if name.endswith(".xlsx"):
-        return pd.read_excel(BytesIO(raw), dtype=str).fillna("")
+        return _read_excel_bytes(raw).fillna("")
     if name.endswith(".csv"):
         try:
             return pd.read_csv(BytesIO(raw), dtype=str, keep_default_na=False, encoding="utf-8-sig").fillna("")
@@ -48,34 +101,71 @@ def save_upload_bytes(storage_dir: Path, alias: str, filename: str, content: str
     return unique_target
 
 
-def read_dictionary(source_path: Path | None):
-    if source_path is None or not source_path.exists():
-        return None, None
-    file_name = source_path.name
-    raw_bytes = source_path.read_bytes()
-
+def _parse_dictionary_bytes(raw_bytes: bytes, file_name: str, usecols: list[str] | None):
     if file_name.lower().endswith(".xlsx"):
-        return pd.read_excel(BytesIO(raw_bytes), dtype=str), file_name
+        return _read_excel_bytes(raw_bytes, usecols)
 
     if file_name.lower().endswith(".csv"):
         try:
-            return pd.read_csv(BytesIO(raw_bytes), dtype=str, keep_default_na=False, encoding="utf-8-sig"), file_name
+            return pd.read_csv(BytesIO(raw_bytes), dtype=str, usecols=usecols, keep_default_na=False, encoding="utf-8-sig")
         except Exception:
-            return pd.read_csv(BytesIO(raw_bytes), dtype=str, keep_default_na=False, encoding="cp949"), file_name
+            return pd.read_csv(BytesIO(raw_bytes), dtype=str, usecols=usecols, keep_default_na=False, encoding="cp949")
 
     try:
-        return pd.read_csv(BytesIO(raw_bytes), sep="\t", dtype=str, keep_default_na=False, encoding="utf-8-sig"), file_name
+        return pd.read_csv(BytesIO(raw_bytes), sep="\t", dtype=str, usecols=usecols, keep_default_na=False, encoding="utf-8-sig")
     except Exception:
-        return pd.read_csv(BytesIO(raw_bytes), sep="\t", dtype=str, keep_default_na=False, encoding="cp949"), file_name
+        return pd.read_csv(BytesIO(raw_bytes), sep="\t", dtype=str, usecols=usecols, keep_default_na=False, encoding="cp949")
+
+
+def read_dictionary(source_path: Path | None, usecols: list[str] | None = None):
+    if source_path is None or not source_path.exists():
+        return None, None
+    file_name = source_path.name
+    raw_bytes = source_path.read_bytes()
+
+    # 매핑 컬럼을 알고 있으면 해당 컬럼만 파싱(없는 컬럼이면 전체를 읽어 호출부에서 안내)
+    if usecols:
+        try:
+            return _parse_dictionary_bytes(raw_bytes, file_name, list(dict.fromkeys(usecols))), file_name
+        except ValueError:
+            pass
+    return _parse_dictionary_bytes(raw_bytes, file_name, None), file_name
 
 
 def read_json_map(source_path: Path | None):
     if source_path is None or not source_path.exists():
         return {}
-    payload = json.loads(source_path.read_text(encoding="utf-8"))
+    payload = _json_loads(source_path.read_bytes())
     if not isinstance(payload, dict):
         return {}
-    return {normalize_text(k): normalize_text(v) for k, v in payload.items()}
+    # 파싱 결과를 한 번 순회하면서 정규화+intern을 함께 처리(중간 dict 없이 바로 결과 생성)
+    intern = sys.intern
+    return {intern(normalize_text(k)): intern(normalize_text(v)) for k, v in payload.items()}
+
+
+# 같은 프로세스에서는 경로 + mtime + 크기가 같으면 파일을 다시 파싱하지 않고 메모리 결과를 재사용
+# (반환 dict는 여러 호출이 공유하므로 읽기 전용으로만 사용)
+@lru_cache(maxsize=16)
+def _read_json_map_cached(path: str, mtime_ns: int, size: int) -> dict:
+    return read_json_map(Path(path))
+
+
+def load_json_map(source_path: Path | None) -> dict:
+    if source_path is None:
+        return {}
+    try:
+        stat = source_path.stat()
+    except OSError:
+        return {}
+    return _read_json_map_cached(str(source_path), stat.st_mtime_ns, stat.st_size)
+
+
+def read_json_maps(source_paths: list[Path | None]) -> list[dict]:
+    # 언어 파일은 서로 독립적이므로 스레드로 동시에 읽음(파일 I/O/orjson 파싱 중첩)
+    if len(source_paths) <= 1:
+        return [load_json_map(p) for p in source_paths]
+    with ThreadPoolExecutor(max_workers=len(source_paths)) as executor:
+        return list(executor.map(load_json_map, source_paths))
 
 
 def build_compare_dataframe(
@@ -91,9 +181,13 @@ def build_compare_dataframe(
 ):
     # JSON 키 매칭 강화: 원본/정규화/소문자/캐노니컬 인덱스를 모두 사용
     def build_lookup_index(source_map: dict) -> dict:
+        # 값 정규화는 JSON 항목당 한 번만 수행하고 변형 키들이 결과를 공유
         index = {}
+        original_values = {}
         for raw_k, raw_v in source_map.items():
             v = normalize_text(raw_v)
+            indexed_v = normalize_text(v)
+            original_values[raw_k] = v
             k0 = str(raw_k)
             k1 = normalize_text(raw_k)
             keys = {
@@ -109,14 +203,16 @@ def build_compare_dataframe(
             keys = {x for x in keys if x}
             for kk in keys:
                 if kk not in index:
-                    index[kk] = v
+                    index[kk] = indexed_v
+        # 원본 키는 원본 값 우선, 변형 키는 인덱스 값 사용
+        index.update(original_values)
         return index
 
     en_lookup = build_lookup_index(en_map)
     ko_lookup = build_lookup_index(ko_map)
     ru_lookup = build_lookup_index(ru_map)
 
-    def get_json_value(source_map: dict, lookup: dict, key: str) -> str:
+    def get_json_value(lookup: dict, key: str) -> str:
         k0 = str(key)
         k1 = normalize_text(key)
         candidates = [
@@ -130,17 +226,21 @@ def build_compare_dataframe(
             canonical_key(k1),
         ]
         for c in candidates:
-            if c in source_map:
-                return normalize_text(source_map.get(c, ""))
             if c in lookup:
-                return normalize_text(lookup.get(c, ""))
+                return lookup[c]
         return ""
 
+    # 대부분의 키는 원본 그대로 일치하므로 dict map으로 한 번에 조회하고, 누락분만 후보 키로 재조회
+    def json_column(lookup: dict, keys: pd.Series) -> list[str]:
+        values = keys.map(lookup).astype(object)
+        missing = values.isna()
+        if missing.any():
+            values[missing] = [get_json_value(lookup, k) for k in keys[missing]]
+        return values.tolist()
+
     base_df = dictionary_df.copy()
-    base_df[english_col] = base_df[english_col].apply(normalize_text)
-    base_df[korean_col] = base_df[korean_col].apply(normalize_text)
-    base_df[russian_col] = base_df[russian_col].apply(normalize_text)
-    base_df[module_col] = base_df[module_col].apply(normalize_text)
+    for col_name in [english_col, korean_col, russian_col, module_col]:
+        base_df[col_name] = _normalize_column_interned(base_df[col_name])
     base_df = base_df[base_df[english_col] != ""].copy()
 
     dictionary_order = list(dict.fromkeys(base_df[english_col].tolist()))
@@ -159,80 +259,54 @@ def build_compare_dataframe(
         )
     )
 
-    ordered_keys = []
-    seen = set()
-
-    def append_order(keys):
-        for key in keys:
-            k = normalize_text(key)
-            if k and k not in seen:
-                seen.add(k)
-                ordered_keys.append(k)
-
-    append_order(dictionary_order)
-    append_order(ko_map.keys())
-    append_order(ru_map.keys())
-    if include_en_keys:
-        append_order(en_map.keys())
-
-    fixed_seq_map = {k: i + 1 for i, k in enumerate(ordered_keys)}
-    out = pd.DataFrame({"비교 Key": ordered_keys})
-    out = out.merge(grouped_df, left_on="비교 Key", right_on="Dictionary English", how="left")
-    out["순번"] = out["비교 Key"].map(fixed_seq_map).astype("Int64")
-
-    if "Dictionary English" not in out.columns:
-        out["Dictionary English"] = ""
-    out["Dictionary English"] = out["Dictionary English"].fillna("").apply(normalize_text)
-
-    for col_name in ["Main Module", "Dictionary Korean", "Dictionary Russian"]:
-        if col_name not in out.columns:
-            out[col_name] = ""
-        out[col_name] = out[col_name].fillna("").apply(normalize_text)
-
-    out["en.json"] = out["비교 Key"].apply(lambda k: get_json_value(en_map, en_lookup, k))
-    out["ko.json"] = out["비교 Key"].apply(lambda k: get_json_value(ko_map, ko_lookup, k))
-    out["ru.json"] = out["비교 Key"].apply(lambda k: get_json_value(ru_map, ru_lookup, k))
-
-    def source_label(row):
-        key = normalize_text(row.get("비교 Key", ""))
-        if key in dictionary_key_set:
-            return "양쪽"
-        return "JSON만"
-
-    out["데이터출처"] = out.apply(source_label, axis=1)
+    # 원본 키를 등장 순서대로 한 번만 모은 뒤 정규화 결과도 순서 유지 dict로 중복 제거
+    raw_keys = dict.fromkeys(
+        chain(dictionary_order, ko_map.keys(), ru_map.keys(), en_map.keys() if include_en_keys else ())
+    )
+    ordered_keys = [k for k in dict.fromkeys(map(normalize_text, raw_keys)) if k]
+
+    # 행 레코드 대신 컬럼 배열(dict-of-arrays)로 모아 DataFrame을 한 번에 생성
+    aligned = grouped_df.set_index("Dictionary English").reindex(ordered_keys)
+    in_dictionary = aligned.index.isin(grouped_df["Dictionary English"])
+    key_series = pd.Series(ordered_keys, dtype=object)
+    # 데이터출처/Dictionary English 판정용 키 정규화는 한 번만 수행해 두 컬럼에서 공유
+    normalized_keys = key_series.map(normalize_text)
+
+    def aligned_column(col_name: str) -> np.ndarray:
+        return normalize_series(aligned[col_name]).to_numpy(dtype=object)
+
+    columns = {
+        "순번": pd.array(range(1, len(ordered_keys) + 1), dtype="Int64"),
+        "비교 Key": ordered_keys,
+        "데이터출처": np.where(normalized_keys.isin(dictionary_key_set), "양쪽", "JSON만").astype(object),
+        "Main Module": aligned_column("Main Module"),
+        "Dictionary English": np.where(in_dictionary, normalized_keys.to_numpy(dtype=object), ""),
+        "Dictionary Korean": aligned_column("Dictionary Korean"),
+        "Dictionary Russian": aligned_column("Dictionary Russian"),
+        "en.json": json_column(en_lookup, key_series),
+        "ko.json": json_column(ko_lookup, key_series),
+        "ru.json": json_column(ru_lookup, key_series),
+    }
+    for col_name in ["KO_Match", "EN_Match", "RU_Match", "Overall_Match", "수정상태", "수정일시"]:
+        columns[col_name] = ""
+    out = pd.DataFrame(columns)
+    out = out.astype({col_name: TEXT_DTYPE for col_name in _TEXT_COLUMNS})
     out = recompute_match_columns(out)
-    out["수정상태"] = ""
-    out["수정일시"] = ""
-
-    out = out.sort_values(by=["순번"], ascending=[True], kind="stable")
-
-    final_columns = [
-        "순번",
-        "비교 Key",
-        "데이터출처",
-        "Main Module",
-        "Dictionary English",
-        "Dictionary Korean",
-        "Dictionary Russian",
-        "en.json",
-        "ko.json",
-        "ru.json",
-        "KO_Match",
-        "EN_Match",
-        "RU_Match",
-        "Overall_Match",
-        "수정상태",
-        "수정일시",
-    ]
-    return out[final_columns].copy(), ordered_keys
+    return out, ordered_keys
 
 
 def guess_mapping_columns(dictionary_df: pd.DataFrame):
     cols = list(dictionary_df.columns)
+    return {**_guess_mapping_for_columns(tuple(cols)), "columns": cols}
+
+
+# 매핑 추정은 헤더만 보므로 컬럼 구성이 같으면 rerun마다 다시 계산하지 않음
+@lru_cache(maxsize=16)
+def _guess_mapping_for_columns(columns: tuple) -> dict:
+    header_df = pd.DataFrame(columns=list(columns))
     return {
-        "module": guess_column(dictionary_df, ["Main Module", "MainModule", "main module", "Module", "모듈", "Main"]),
-        "english": guess_column(dictionary_df, ["English", "Enlish", "Englsh", "EN", "en", "영어", "영문"]),
-        "korean": guess_column(dictionary_df, ["Korean", "KO", "ko", "한국어", "국문", "KOR"]),
-        "russian": guess_column(dictionary_df, ["Russian", "RU", "ru", "러시아어", "러문", "RUS"]),
-        "columns": cols,
+        "module": guess_column(header_df, ["Main Module", "MainModule", "main module", "Module", "모듈", "Main"]),
+        "english": guess_column(header_df, ["English", "Enlish", "Englsh", "EN", "en", "영어", "영문"]),
+        "korean": guess_column(header_df, ["Korean", "KO", "ko", "한국어", "국문", "KOR"]),
+        "russian": guess_column(header_df, ["Russian", "RU", "ru", "러시아어", "러문", "RUS"]),
     }
@@ -3,11 +3,21 @@ from io import BytesIO
 import pandas as pd
 
 from pathlib import Path
+from openpyxl import Workbook
 from openpyxl.formatting.rule import CellIsRule
-from openpyxl.styles import PatternFill
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
 
 from app_modules.storage_utils import current_timestamp_text, export_dir_path, reserve_next_version
 
+# pyarrow가 있으면 CSV를 C++ 작성기로 기록 (없거나 변환 불가 컬럼이면 pandas to_csv 사용)
+try:
+    import pyarrow as _pa
+    import pyarrow.csv as _pa_csv
+except ImportError:
+    _pa = None
+    _pa_csv = None
+
 
 # 파일 내보내기 기능 모듈
 
@@ -34,15 +44,8 @@ def _norm_formula(cell_ref: str) -> str:
     )
 
 
-def _apply_excel_match_formulas_and_styles(worksheet, dataframe: pd.DataFrame):
-    if dataframe.empty:
-        return
-
+def _excel_formula_plan(dataframe: pd.DataFrame):
     idx = _column_index_map(dataframe)
-    max_row = len(dataframe) + 1
-    if max_row < 2:
-        return
-
     required_columns = [
         "Dictionary English",
         "Dictionary Korean",
@@ -55,8 +58,8 @@ def _apply_excel_match_formulas_and_styles(worksheet, dataframe: pd.DataFrame):
         "RU_Match",
         "Overall_Match",
     ]
-    if any(col not in idx for col in required_columns):
-        return
+    if dataframe.empty or any(col not in idx for col in required_columns):
+        return None
 
     helper_specs = [
         ("Dictionary Korean", "__NORM_DICTIONARY_KOREAN"),
@@ -66,55 +69,51 @@ def _apply_excel_match_formulas_and_styles(worksheet, dataframe: pd.DataFrame):
         ("Dictionary Russian", "__NORM_DICTIONARY_RUSSIAN"),
         ("ru.json", "__NORM_RU_JSON"),
     ]
-
-    helper_start_idx = worksheet.max_column + 1
-    helper_idx = {}
-    for offset, (_, helper_name) in enumerate(helper_specs):
-        col_idx = helper_start_idx + offset
-        helper_idx[helper_name] = col_idx
-        worksheet.cell(row=1, column=col_idx, value=helper_name)
-
-    for row in range(2, max_row + 1):
-        for source_col_name, helper_name in helper_specs:
-            source_cell = f"{_col_letter(idx[source_col_name])}{row}"
-            helper_cell = worksheet.cell(row=row, column=helper_idx[helper_name])
-            helper_cell.value = _norm_formula(source_cell)
-
-        ko_dict = f"{_col_letter(helper_idx['__NORM_DICTIONARY_KOREAN'])}{row}"
-        ko_json = f"{_col_letter(helper_idx['__NORM_KO_JSON'])}{row}"
-        en_dict = f"{_col_letter(helper_idx['__NORM_DICTIONARY_ENGLISH'])}{row}"
-        en_json = f"{_col_letter(helper_idx['__NORM_EN_JSON'])}{row}"
-        ru_dict = f"{_col_letter(helper_idx['__NORM_DICTIONARY_RUSSIAN'])}{row}"
-        ru_json = f"{_col_letter(helper_idx['__NORM_RU_JSON'])}{row}"
-
-        worksheet.cell(row=row, column=idx["KO_Match"]).value = (
+    helper_start_idx = len(dataframe.columns) + 1
+    helper_idx = {helper_name: helper_start_idx + offset for offset, (_, helper_name) in enumerate(helper_specs)}
+
+    # 행 번호만 바뀌므로 열 문자를 채운 수식 템플릿을 한 번 만들고 행마다 format만 수행
+    ko_dict = f"{_col_letter(helper_idx['__NORM_DICTIONARY_KOREAN'])}{{row}}"
+    ko_json = f"{_col_letter(helper_idx['__NORM_KO_JSON'])}{{row}}"
+    en_dict = f"{_col_letter(helper_idx['__NORM_DICTIONARY_ENGLISH'])}{{row}}"
+    en_json = f"{_col_letter(helper_idx['__NORM_EN_JSON'])}{{row}}"
+    ru_dict = f"{_col_letter(helper_idx['__NORM_DICTIONARY_RUSSIAN'])}{{row}}"
+    ru_json = f"{_col_letter(helper_idx['__NORM_RU_JSON'])}{{row}}"
+    ko_match_cell = f"{_col_letter(idx['KO_Match'])}{{row}}"
+    en_match_cell = f"{_col_letter(idx['EN_Match'])}{{row}}"
+    ru_match_cell = f"{_col_letter(idx['RU_Match'])}{{row}}"
+
+    helper_templates = [_norm_formula(f"{_col_letter(idx[source_col_name])}{{row}}") for source_col_name, _ in helper_specs]
+    match_templates = {
+        idx["KO_Match"]: (
             f'=IF({ko_json}="","파일없음",'
             f'IF({ko_dict}="","N",'
             f'IF(ISNUMBER(SEARCH(","&{ko_json}&",",","&SUBSTITUTE({ko_dict},", ",",")&",")),"Y","N")))'
-        )
-        worksheet.cell(row=row, column=idx["EN_Match"]).value = (
+        ),
+        idx["EN_Match"]: (
             f'=IF({en_json}="","파일없음",'
             f'IF({en_dict}="","N",'
             f'IF(ISNUMBER(SEARCH(","&{en_json}&",",","&SUBSTITUTE({en_dict},", ",",")&",")),"Y","N")))'
-        )
-        worksheet.cell(row=row, column=idx["RU_Match"]).value = (
+        ),
+        idx["RU_Match"]: (
             f'=IF({ru_json}="","파일없음",'
             f'IF({ru_dict}="","N",'
             f'IF(ISNUMBER(SEARCH(","&{ru_json}&",",","&SUBSTITUTE({ru_dict},", ",",")&",")),"Y","N")))'
-        )
-
-        ko_match_cell = f"{_col_letter(idx['KO_Match'])}{row}"
-        en_match_cell = f"{_col_letter(idx['EN_Match'])}{row}"
-        ru_match_cell = f"{_col_letter(idx['RU_Match'])}{row}"
-        worksheet.cell(row=row, column=idx["Overall_Match"]).value = (
+        ),
+        idx["Overall_Match"]: (
             f'=IF(OR({ko_match_cell}="파일없음",{en_match_cell}="파일없음",{ru_match_cell}="파일없음"),"파일없음",'
             f'IF(AND({ko_match_cell}="Y",{en_match_cell}="Y",{ru_match_cell}="Y"),"Y","N"))'
-        )
+        ),
+    }
+    match_letters = [_col_letter(idx[col]) for col in ["KO_Match", "EN_Match", "RU_Match", "Overall_Match"]]
+    helper_letters = [_col_letter(col_idx) for col_idx in helper_idx.values()]
+    return [name for _, name in helper_specs], helper_templates, match_templates, match_letters, helper_letters
+
 
+def _add_match_conditional_formats(worksheet, match_letters: list[str], max_row: int):
     yellow_fill = PatternFill(start_color="FFF59D", end_color="FFF59D", fill_type="solid")
     gray_fill = PatternFill(start_color="ECEFF1", end_color="ECEFF1", fill_type="solid")
-    for match_col in ["KO_Match", "EN_Match", "RU_Match", "Overall_Match"]:
-        letter = _col_letter(idx[match_col])
+    for letter in match_letters:
         cell_range = f"{letter}2:{letter}{max_row}"
         worksheet.conditional_formatting.add(
             cell_range,
@@ -125,15 +124,86 @@ def _apply_excel_match_formulas_and_styles(worksheet, dataframe: pd.DataFrame):
             CellIsRule(operator="equal", formula=['"파일없음"'], fill=gray_fill),
         )
 
-    for helper_col_idx in helper_idx.values():
-        worksheet.column_dimensions[_col_letter(helper_col_idx)].hidden = True
+
+def _styled_header_cells(worksheet, names: list[str]) -> list[WriteOnlyCell]:
+    # pandas to_excel 헤더와 같은 스타일(굵게, 얇은 테두리, 가운데/위 정렬)
+    thin = Side(style="thin")
+    font = Font(bold=True)
+    border = Border(left=thin, right=thin, top=thin, bottom=thin)
+    alignment = Alignment(horizontal="center", vertical="top")
+    cells = []
+    for name in names:
+        cell = WriteOnlyCell(worksheet, value=name)
+        cell.font = font
+        cell.border = border
+        cell.alignment = alignment
+        cells.append(cell)
+    return cells
+
+
+def write_dataframe_to_excel(dataframe: pd.DataFrame, target) -> None:
+    # write_only 워크북으로 값+수식을 행 단위로 바로 기록 (전체 셀 객체를 메모리에 만들지 않음)
+    # target은 파일 경로 또는 바이너리 파일 객체
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet("Compare")
+    plan = _excel_formula_plan(dataframe)
+
+    header = _styled_header_cells(worksheet, [str(c) for c in dataframe.columns])
+    if plan is not None:
+        helper_names, helper_templates, match_templates, match_letters, helper_letters = plan
+        # write_only 시트는 열 너비/숨김을 행보다 먼저 지정해야 함
+        for letter in helper_letters:
+            worksheet.column_dimensions[letter].hidden = True
+        header += helper_names
+    worksheet.append(header)
+
+    column_values = [
+        dataframe.iloc[:, pos].to_numpy(dtype=object, na_value=None) for pos in range(len(dataframe.columns))
+    ]
+    for row_no, values in enumerate(zip(*column_values), start=2):
+        row = list(values)
+        if plan is not None:
+            for col_idx, template in match_templates.items():
+                row[col_idx - 1] = template.format(row=row_no)
+            row.extend(template.format(row=row_no) for template in helper_templates)
+        worksheet.append(row)
+
+    if plan is not None:
+        _add_match_conditional_formats(worksheet, match_letters, len(dataframe) + 1)
+
+    workbook.save(target)
+
 
 def dataframe_to_excel_bytes(dataframe: pd.DataFrame) -> bytes:
     bio = BytesIO()
-    with pd.ExcelWriter(bio, engine="openpyxl") as writer:
-        dataframe.to_excel(writer, index=False, sheet_name="Compare")
-        worksheet = writer.book["Compare"]
-        _apply_excel_match_formulas_and_styles(worksheet, dataframe)
+    write_dataframe_to_excel(dataframe, bio)
+    return bio.getvalue()
+
+
+def write_dataframe_to_csv(dataframe: pd.DataFrame, target) -> None:
+    # Excel 호환을 위해 UTF-8 BOM을 붙이고 결측값은 빈 칸으로 기록
+    # target은 파일 경로 또는 바이너리 파일 객체
+    if _pa is not None:
+        # Arrow 출력은 버퍼에 먼저 만들고 성공했을 때만 기록 (list/struct 열 등 실패 시 pandas로 대체)
+        try:
+            table = _pa.Table.from_pandas(dataframe, preserve_index=False)
+            sink = _pa.BufferOutputStream()
+            _pa_csv.write_csv(table, sink, write_options=_pa_csv.WriteOptions(quoting_style="needed"))
+            payload = b"\xef\xbb\xbf" + sink.getvalue().to_pybytes()
+        except _pa.ArrowException:
+            payload = None
+        if payload is not None:
+            if isinstance(target, (str, Path)):
+                Path(target).write_bytes(payload)
+            else:
+                target.write(payload)
+            return
+    dataframe.to_csv(target, index=False, encoding="utf-8-sig")
+
+
+def dataframe_to_csv_bytes(dataframe: pd.DataFrame) -> bytes:
+    bio = BytesIO()
+    write_dataframe_to_csv(dataframe, bio)
     return bio.getvalue()
 
 
@@ -146,7 +216,7 @@ def save_dataframe_to_export_folder(dataframe: pd.DataFrame, base_name: str, exp
     csv_path = target_dir / f"{base_name}_v{version}_{ts}.csv"
     xlsx_path = target_dir / f"{base_name}_v{version}_{ts}.xlsx"
 
-    dataframe.to_csv(csv_path, index=False, encoding="utf-8-sig")
-    excel_bytes = dataframe_to_excel_bytes(dataframe)
-    xlsx_path.write_bytes(excel_bytes)
+    write_dataframe_to_csv(dataframe, csv_path)
+    # 폴더 저장은 바이트를 메모리에 모으지 않고 파일로 바로 기록
+    write_dataframe_to_excel(dataframe, xlsx_path)
     return csv_path, xlsx_path, version, ts
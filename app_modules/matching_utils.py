@@ -1,9 +1,18 @@
 from difflib import SequenceMatcher
 from functools import lru_cache
 
+import numpy as np
 import pandas as pd
 
-from app_modules.text_utils import normalize_text, normalize_header_name
+from app_modules.text_utils import normalize_header_name, normalize_series, normalize_text
+
+# rapidfuzz(C++ 구현)가 설치되어 있으면 헤더 유사도 점수 계산에 우선 사용
+try:
+    from rapidfuzz import fuzz as _fuzz
+    from rapidfuzz import process as _fuzz_process
+except ImportError:
+    _fuzz = None
+    _fuzz_process = None
 
 
 # 컬럼 추정, 값 병합, 매치 계산 등 비교 핵심 로직 모듈
@@ -27,33 +36,57 @@ def guess_column(df: pd.DataFrame, candidates):
         if normalized_candidate in normalized_map:
             return normalized_map[normalized_candidate]
 
-    scored = []
-    for candidate in candidates:
-        normalized_candidate = normalize_header_name(candidate)
-        if not normalized_candidate:
-            continue
+    if _fuzz_process is not None:
+        # 정규화 이름별 첫 열만 후보로 두고 후보명마다 extractOne으로 최고 점수 열을 찾음
+        choices = {}
         for col in columns:
             normalized_col = normalize_header_name(col)
-            if not normalized_col:
+            if normalized_col:
+                choices.setdefault(normalized_col, col)
+        choice_names = list(choices)
+        best = None
+        for candidate in candidates:
+            normalized_candidate = normalize_header_name(candidate)
+            if not normalized_candidate:
                 continue
-            score = SequenceMatcher(None, normalized_candidate, normalized_col).ratio()
-            scored.append((score, col))
-
-    if scored:
-        scored.sort(key=lambda x: x[0], reverse=True)
-        best_score, best_col = scored[0]
-        if best_score >= 0.78:
-            return best_col
+            match = _fuzz_process.extractOne(normalized_candidate, choice_names, scorer=_fuzz.ratio, score_cutoff=78)
+            if match is not None and (best is None or match[1] > best[1]):
+                best = match
+        return choices[best[0]] if best is not None else None
+
+    # 열 이름 정규화는 한 번만 하고, 열마다 SequenceMatcher의 b(열 이름) 인덱스를 재사용
+    normalized_candidates = [normalize_header_name(candidate) for candidate in candidates]
+    normalized_candidates = [name for name in normalized_candidates if name]
+    normalized_cols = [(col, normalize_header_name(col)) for col in columns]
+    normalized_cols = [(col, name) for col, name in normalized_cols if name]
+    scores = {}
+    # 헤더는 짧은 문자열이라 autojunk(200자 이상에서만 동작)가 필요 없음
+    matcher = SequenceMatcher(None, autojunk=False)
+    for col_pos, (_, normalized_col) in enumerate(normalized_cols):
+        matcher.set_seq2(normalized_col)
+        for cand_pos, normalized_candidate in enumerate(normalized_candidates):
+            matcher.set_seq1(normalized_candidate)
+            # 길이/문자 빈도 기반 상한(real_quick_ratio, quick_ratio)이 기준 미만이면 ratio 계산 생략
+            if matcher.real_quick_ratio() < 0.78 or matcher.quick_ratio() < 0.78:
+                continue
+            score = matcher.ratio()
+            if score >= 0.78:
+                scores[cand_pos, col_pos] = score
 
-    return None
+    # 후보 순서 -> 열 순서로 훑어 기준 이상 최고 점수의 첫 항목 선택 (기존 안정 정렬 결과와 동일)
+    best_score, best_col = None, None
+    for cand_pos in range(len(normalized_candidates)):
+        for col_pos, (col, _) in enumerate(normalized_cols):
+            score = scores.get((cand_pos, col_pos))
+            if score is not None and (best_score is None or score > best_score):
+                best_score, best_col = score, col
+    return best_col
 
 
 def unique_join(series: pd.Series) -> str:
-    merged = []
-    for value in series:
-        normalized = normalize_text(value)
-        if normalized and normalized not in merged:
-            merged.append(normalized)
+    # dict 키로 첫 등장 순서를 유지한 채 중복 제거 (리스트 포함 검사 O(n^2) 회피)
+    merged = dict.fromkeys(normalize_text(value) for value in series)
+    merged.pop("", None)
     return ", ".join(merged)
 
 
@@ -73,14 +106,14 @@ def evaluate_binary_match(dictionary_value_joined: str, json_value: str) -> str:
     if left == "":
         return "N"
 
-    return "Y" if right in _candidate_tuple(left) else "N"
+    return "Y" if right in _candidate_set(left) else "N"
 
 
-@lru_cache(maxsize=50000)
-def _candidate_tuple(joined: str) -> tuple[str, ...]:
-    candidates = [normalize_text(x) for x in str(joined).split(",")]
-    candidates = [x for x in candidates if x]
-    return tuple(candidates)
+# 사전 값(쉼표로 이은 동의어 목록)별 후보 집합을 캐시해 포함 여부를 해시 조회로 판정
+@lru_cache(maxsize=200000)
+def _candidate_set(joined: str) -> frozenset[str]:
+    candidates = (normalize_text(x) for x in str(joined).split(","))
+    return frozenset(x for x in candidates if x)
 
 
 def evaluate_overall_match(row) -> str:
@@ -90,29 +123,56 @@ def evaluate_overall_match(row) -> str:
     return "Y" if states[0] == "Y" and states[1] == "Y" and states[2] == "Y" else "N"
 
 
+# 매치 상태를 정수 코드(0=N, 1=Y, 2=파일없음)로 계산하고 마지막에 한 번만 문자열로 변환
+MATCH_STATE_LABELS = np.array(["N", "Y", "파일없음"], dtype=object)
+_CODE_N, _CODE_Y, _CODE_MISSING = 0, 1, 2
+
+
+def _binary_match_codes(left: pd.Series, right: pd.Series) -> np.ndarray:
+    # evaluate_binary_match와 같은 판정을 컬럼 단위로 수행: 정규화는 고유값 단위,
+    # 쉼표가 없는 사전 값은 후보가 자신 하나뿐이므로 배열 비교로 끝내고 쉼표가 있는 값만 후보 집합으로 판정
+    left_norm = normalize_series(left)
+    left_values = left_norm.to_numpy(dtype=object)
+    left_single = normalize_series(left_norm).to_numpy(dtype=object)
+    right_values = normalize_series(right).to_numpy(dtype=object)
+
+    right_empty = right_values == ""
+    left_empty = left_values == ""
+    codes = (left_single == right_values).astype(np.uint8)
+    codes[left_empty] = _CODE_N
+    codes[right_empty] = _CODE_MISSING
+
+    multi = left_norm.str.contains(",", regex=False).to_numpy(dtype=bool) & ~right_empty & ~left_empty
+    for i in np.flatnonzero(multi):
+        codes[i] = _CODE_Y if right_values[i] in _candidate_set(left_values[i]) else _CODE_N
+    return codes
+
+
 def recompute_match_columns(df: pd.DataFrame) -> pd.DataFrame:
-    ko_left = df["Dictionary Korean"].fillna("").tolist()
-    ko_right = df["ko.json"].fillna("").tolist()
-    en_left = df["Dictionary English"].fillna("").tolist()
-    en_right = df["en.json"].fillna("").tolist()
-    ru_left = df["Dictionary Russian"].fillna("").tolist()
-    ru_right = df["ru.json"].fillna("").tolist()
-
-    ko_match = [evaluate_binary_match(l, r) for l, r in zip(ko_left, ko_right)]
-    en_match = [evaluate_binary_match(l, r) for l, r in zip(en_left, en_right)]
-    ru_match = [evaluate_binary_match(l, r) for l, r in zip(ru_left, ru_right)]
-
-    overall_match = []
-    for k, e, r in zip(ko_match, en_match, ru_match):
-        if "파일없음" in (k, e, r):
-            overall_match.append("파일없음")
-        elif k == "Y" and e == "Y" and r == "Y":
-            overall_match.append("Y")
-        else:
-            overall_match.append("N")
-
-    df["KO_Match"] = ko_match
-    df["EN_Match"] = en_match
-    df["RU_Match"] = ru_match
-    df["Overall_Match"] = overall_match
+    ko_codes = _binary_match_codes(df["Dictionary Korean"], df["ko.json"])
+    en_codes = _binary_match_codes(df["Dictionary English"], df["en.json"])
+    ru_codes = _binary_match_codes(df["Dictionary Russian"], df["ru.json"])
+
+    any_missing = (ko_codes == _CODE_MISSING) | (en_codes == _CODE_MISSING) | (ru_codes == _CODE_MISSING)
+    all_yes = (ko_codes == _CODE_Y) & (en_codes == _CODE_Y) & (ru_codes == _CODE_Y)
+    overall_codes = all_yes.astype(np.uint8)
+    overall_codes[any_missing] = _CODE_MISSING
+
+    df["KO_Match"] = MATCH_STATE_LABELS[ko_codes]
+    df["EN_Match"] = MATCH_STATE_LABELS[en_codes]
+    df["RU_Match"] = MATCH_STATE_LABELS[ru_codes]
+    df["Overall_Match"] = MATCH_STATE_LABELS[overall_codes]
+    return df
+
+
+# 매치 컬럼은 Y/N/파일없음(+빈 값)만 가지므로 범주형으로 바꿔 코드 비교로 필터/집계
+MATCH_CATEGORIES = ["Y", "N", "파일없음", ""]
+
+
+def categorize_match_columns(df: pd.DataFrame, match_cols: list[str]) -> pd.DataFrame:
+    for col in match_cols:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            values = df[col].astype(str)
+            if values.isin(MATCH_CATEGORIES).all():
+                df[col] = pd.Categorical(values, categories=MATCH_CATEGORIES)
     return df
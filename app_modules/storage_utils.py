@@ -1,14 +1,20 @@
+import fnmatch
+import hashlib
+import inspect
 import json
 import os
+import pickle
 from datetime import datetime
-from decimal import Decimal
 from pathlib import Path
-from functools import lru_cache
+from functools import lru_cache, wraps
 
 
 # 로컬 저장 위치(데스크탑 우선)를 관리하는 모듈
 
 CONFIG_FILE_NAME = ".automatic_tool_config.json"
+CACHE_MAX_ENTRIES = 8
+# 비교 결과 캐시 키에 소스 내용을 포함할 모듈(정규화/매칭/비교 로직이 바뀌면 캐시가 자동 무효화)
+_CACHE_SOURCE_MODULES = ("compare_logic.py", "matching_utils.py", "text_utils.py", "storage_utils.py")
 
 
 @lru_cache(maxsize=1)
@@ -50,17 +56,27 @@ def _config_file_path() -> Path:
 
 def _load_config() -> dict:
     path = _config_file_path()
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except OSError:
         return {}
+    # 수정시각/크기가 같으면 다시 읽지 않음 (호출자가 값을 바꿀 수 있으므로 사본 반환)
+    return dict(_load_config_cached(str(path), stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=4)
+def _load_config_cached(path_text: str, mtime_ns: int, size: int) -> dict:
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        payload = json.loads(Path(path_text).read_text(encoding="utf-8"))
     except Exception:
         return {}
+    return payload if isinstance(payload, dict) else {}
 
 
 def _save_config(payload: dict):
     path = _config_file_path()
     path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    _load_config_cached.cache_clear()
 
 
 def set_storage_dir(path_text: str | None) -> Path:
@@ -75,19 +91,29 @@ def set_storage_dir(path_text: str | None) -> Path:
 
 
 def resolve_storage_dir(preferred: str | Path | None = None) -> Path:
+    # 지정 경로/환경변수/설정값이 같으면 경로 계산과 mkdir을 건너뛰고, 폴더가 사라졌을 때만 다시 생성
+    preferred_text = str(preferred) if preferred else None
+    env_storage = None if preferred_text else _get_env("AUTOMATIC_TOOL_STORAGE_DIR")
+    cfg_storage = None if preferred_text or env_storage else _load_config().get("storage_dir")
+    target = _resolve_storage_dir_cached(preferred_text, env_storage, cfg_storage)
+    if not target.is_dir():
+        _resolve_storage_dir_cached.cache_clear()
+        target = _resolve_storage_dir_cached(preferred_text, env_storage, cfg_storage)
+    return target
+
+
+@lru_cache(maxsize=32)
+def _resolve_storage_dir_cached(preferred: str | None, env_storage: str | None, cfg_storage: str | None) -> Path:
     if preferred:
         target = Path(preferred).expanduser().resolve()
         target.mkdir(parents=True, exist_ok=True)
         return target
 
-    env_storage = _get_env("AUTOMATIC_TOOL_STORAGE_DIR")
     if env_storage:
         target = Path(env_storage).expanduser().resolve()
         target.mkdir(parents=True, exist_ok=True)
         return target
 
-    cfg = _load_config()
-    cfg_storage = cfg.get("storage_dir")
     if cfg_storage:
         target = Path(cfg_storage).expanduser().resolve()
         target.mkdir(parents=True, exist_ok=True)
@@ -123,9 +149,21 @@ def save_uploaded_file(uploaded_file, alias_name: str, storage_dir: str | Path |
 
 
 def get_saved_file_path(alias_name: str, storage_dir: str | Path | None = None):
+    return get_saved_file_paths([alias_name], storage_dir)[alias_name]
+
+
+def get_saved_file_paths(alias_names: list[str], storage_dir: str | Path | None = None) -> dict[str, Path | None]:
     storage_dir = resolve_storage_dir(storage_dir)
+    # 폴더 항목은 scandir로 한 번만 읽고 별칭/패턴별 비교는 메모리에서 수행 (별칭·glob 패턴마다 폴더를 다시 훑지 않음)
+    with os.scandir(storage_dir) as it:
+        entries = list(it)
+    return {alias_name: _pick_saved_file(alias_name, storage_dir, entries) for alias_name in alias_names}
+
+
+def _pick_saved_file(alias_name: str, storage_dir: Path, entries: list[os.DirEntry]):
     # 1) 내부 고정 별칭 파일 우선(dictionary_latest.*, ko_latest.* ...)
-    matches = sorted(storage_dir.glob(f"{alias_name}.*"))
+    alias_pattern = f"{alias_name}.*"
+    matches = sorted(storage_dir / entry.name for entry in entries if fnmatch.fnmatch(entry.name, alias_pattern))
     if matches:
         return matches[-1]
 
@@ -138,16 +176,16 @@ def get_saved_file_path(alias_name: str, storage_dir: str | Path | None = None):
     }
 
     patterns = fallback_patterns.get(alias_name, [])
-    fallback_candidates: list[Path] = []
+    fallback_candidates: list[os.DirEntry] = []
     for pattern in patterns:
-        fallback_candidates.extend([p for p in storage_dir.glob(pattern) if p.is_file()])
+        fallback_candidates.extend([e for e in entries if fnmatch.fnmatch(e.name, pattern) and e.is_file()])
 
     if not fallback_candidates:
         return None
 
     # 최근 수정 파일을 우선 사용
-    fallback_candidates.sort(key=lambda p: p.stat().st_mtime)
-    return fallback_candidates[-1]
+    fallback_candidates.sort(key=lambda e: e.stat().st_mtime)
+    return storage_dir / fallback_candidates[-1].name
 
 
 def current_timestamp_text() -> str:
@@ -162,15 +200,134 @@ def _version_state_path(storage_dir: str | Path | None = None) -> Path:
 
 def reserve_next_version(storage_dir: str | Path | None = None) -> str:
     state_path = _version_state_path(storage_dir)
-    current = Decimal("0.9")
+    # 버전은 0.1 단위 정수(tenths)로 계산하고 상태 파일에는 기존과 같은 "x.y" 문자열로 저장
+    current_tenths = 9
 
     if state_path.exists():
         try:
             payload = json.loads(state_path.read_text(encoding="utf-8"))
-            current = Decimal(str(payload.get("current", "0.9")))
+            current_tenths = round(float(str(payload.get("current", "0.9"))) * 10)
         except Exception:
-            current = Decimal("0.9")
+            current_tenths = 9
+
+    next_tenths = current_tenths + 1
+    next_version = f"{next_tenths // 10}.{next_tenths % 10}"
+    state_path.write_text(json.dumps({"current": next_version}, ensure_ascii=False, indent=2), encoding="utf-8")
+    return next_version
+
+
+# 디버그 스크립트용: 비교 결과를 입력 파일 지문 + 비교 코드 지문 해시로 디스크 캐시
+# 공유될 수 있는 저장 폴더가 아니라 사용자 홈의 캐시 폴더에만 pickle을 읽고 씀
+# (AUTOMATIC_TOOL_NO_CACHE=1이면 비활성, 최근 CACHE_MAX_ENTRIES개만 유지)
+
+def _cache_disabled() -> bool:
+    return str(_get_env("AUTOMATIC_TOOL_NO_CACHE") or "").strip().lower() in {"1", "true", "on", "yes", "y"}
+
+
+def _cache_path(fingerprint: str, prefix: str, ext: str) -> Path:
+    digest = hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()
+    return _cache_dir() / f"{prefix}{digest}{ext}"
+
+
+def _cache_dir() -> Path:
+    return Path.home() / ".cache" / "automatic_tool"
+
 
-    next_version = (current + Decimal("0.1")).quantize(Decimal("0.0"))
-    state_path.write_text(json.dumps({"current": str(next_version)}, ensure_ascii=False, indent=2), encoding="utf-8")
-    return str(next_version)
+@lru_cache(maxsize=8)
+def _code_fingerprint(func_source_file: str | None) -> str:
+    module_dir = Path(__file__).resolve().parent
+    paths = [module_dir / name for name in _CACHE_SOURCE_MODULES]
+    if func_source_file:
+        paths.append(Path(func_source_file))
+    digest = hashlib.sha1()
+    for path in paths:
+        try:
+            digest.update(path.read_bytes())
+        except OSError:
+            digest.update(f"missing:{path}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _load_cached(cache_path: Path):
+    # 캐시 파일이 없으면 read_bytes의 예외로 처리 (별도 exists() 호출 없음)
+    try:
+        value = pickle.loads(cache_path.read_bytes())
+    except Exception:
+        return None
+    # 적중한 항목은 수정시각을 갱신해 정리 대상에서 뒤로 미룸
+    try:
+        os.utime(cache_path)
+    except OSError:
+        pass
+    return value
+
+
+def _prune_cache(cache_dir: Path, pattern: str, keep: int) -> None:
+    try:
+        entries = sorted(cache_dir.glob(pattern), key=lambda e: e.stat().st_mtime, reverse=True)
+    except OSError:
+        return
+    for stale in entries[keep:]:
+        try:
+            stale.unlink()
+        except OSError:
+            pass
+
+
+def _store_cached(cache_path: Path, value) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return
+    _prune_cache(cache_path.parent, "compare_*.pkl", CACHE_MAX_ENTRIES)
+
+
+def _source_fingerprint(path_text: str | Path | None) -> str:
+    if not path_text:
+        return "none"
+    path = Path(path_text)
+    if not path.is_file():
+        return f"missing:{path}"
+    stat = path.stat()
+    with path.open("rb") as handle:
+        head_digest = hashlib.sha1(handle.read(1 << 20)).hexdigest()
+    return f"{path.resolve()}:{stat.st_mtime}:{stat.st_size}:{head_digest}"
+
+
+def memoize_compare(func):
+    # 비교 코드 지문(관련 모듈 + 감싼 함수 파일 내용) + 첫 인자(source_paths)의 4개 파일 지문
+    # + 나머지 인자(컬럼/옵션)를 키로 사용
+    # (결과 DataFrame, 상태 문구) 중 결과가 비어 있는 실패 결과는 저장하지 않음
+    @wraps(func)
+    def wrapper(source_paths, *args, **kwargs):
+        if _cache_disabled():
+            return func(source_paths, *args, **kwargs)
+
+        source_paths = dict(source_paths or {})
+        bound = inspect.signature(func).bind(source_paths, *args, **kwargs)
+        bound.apply_defaults()
+        options = {k: v for k, v in bound.arguments.items() if k != "source_paths"}
+        fingerprint = json.dumps(
+            {
+                "code": _code_fingerprint(inspect.getsourcefile(func)),
+                "func": func.__qualname__,
+                "sources": {k: _source_fingerprint(source_paths.get(k)) for k in ["dictionary", "ko", "ru", "en"]},
+                "options": options,
+            },
+            ensure_ascii=False,
+            sort_keys=True,
+            default=str,
+        )
+        cache_path = _cache_path(fingerprint, "compare_", ".pkl")
+        cached = _load_cached(cache_path)
+        if cached is not None:
+            return cached
+
+        result = func(source_paths, *args, **kwargs)
+        result_df = result[0] if isinstance(result, tuple) and result else None
+        if result_df is not None and not getattr(result_df, "empty", True):
+            _store_cached(cache_path, result)
+        return result
+
+    return wrapper
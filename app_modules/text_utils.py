@@ -1,41 +1,136 @@
+import importlib.util
 import re
-import pandas as pd
 import unicodedata
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
 
 
 # 텍스트 비교 전에 형태를 통일하기 위한 정규화 유틸
 
+# 비교 텍스트 컬럼은 pyarrow가 있으면 Arrow 문자열(연속 버퍼)로 보관
+TEXT_DTYPE = "string[pyarrow]" if importlib.util.find_spec("pyarrow") is not None else "string"
+
+
 def normalize_text(value) -> str:
     if value is None:
         return ""
     if isinstance(value, float) and pd.isna(value):
         return ""
+    return _normalize_text_cached(str(value))
+
+
+# 문자 단위 치환은 번역 테이블 한 번으로 처리 (BOM/zero-width space 제거, NBSP/스마트 따옴표 통일)
+_CHAR_TRANSLATION = str.maketrans(
+    {
+        "\ufeff": None,
+        "\u200b": None,
+        "\u00A0": " ",
+        "“": '"',
+        "”": '"',
+        "’": "'",
+        "‘": "'",
+    }
+)
+_NEWLINE_RE = re.compile(r"\r\n?")
+_INLINE_SPACE_RE = re.compile(r"[ \t]+")
+# 정규화가 바뀌게 만드는 문자/패턴이 하나도 없으면 원본 문자열을 그대로 반환
+_NEEDS_NORMALIZE_RE = re.compile(r"[\ufeff\u200b\r\u00A0“”’‘\t]|  |^\s|\s$")
+_WHITESPACE_RUN_RE = re.compile(r"\s+")
+_HEADER_STRIP_RE = re.compile(r"[^a-z0-9가-힣]+")
+# 양끝을 벗겨낼 따옴표 문자 (정규화마다 평가되므로 해시 조회용 상수로 둠)
+_QUOTE_CHARS = frozenset("'\"")
 
-    text = str(value)
-    text = text.replace("\ufeff", "")  # BOM 제거
-    text = text.replace("\u200b", "")  # zero-width space 제거
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
-    text = text.replace("\u00A0", " ")
-    text = text.replace("“", '"').replace("”", '"').replace("’", "'").replace("‘", "'")
+
+# 같은 문자열이 반복되는 번역 데이터 특성상 정규화 결과를 문자열 단위로 캐시
+@lru_cache(maxsize=200000)
+def _normalize_text_cached(text: str) -> str:
+    # 순수 ASCII 문자열은 CR/탭/연속 공백/앞뒤 공백만 확인하면 되므로 정규식 검색 없이 판정
+    if text.isascii():
+        needs_normalize = "\r" in text or "\t" in text or "  " in text or text[:1].isspace() or text[-1:].isspace()
+    else:
+        needs_normalize = _NEEDS_NORMALIZE_RE.search(text) is not None
+    if not needs_normalize and not (len(text) >= 2 and text[0] == text[-1] and text[0] in _QUOTE_CHARS):
+        return text
+    text = text.translate(_CHAR_TRANSLATION)
+    text = _NEWLINE_RE.sub("\n", text)
     text = text.strip()
-    text = re.sub(r"[ \t]+", " ", text)
+    text = _INLINE_SPACE_RE.sub(" ", text)
 
-    if len(text) >= 2 and text[0] == text[-1] and text[0] in ["'", '"']:
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in _QUOTE_CHARS:
         text = text[1:-1].strip()
 
     return text
 
 
+# 컬럼 전체 정규화: 고유값만 한 번씩 정규화한 뒤 코드 배열로 펼침 (결측은 빈 문자열)
+
+def normalize_series(series: pd.Series) -> pd.Series:
+    codes, uniques = pd.factorize(series.fillna("").astype(str))
+    # 고유값은 모두 str이므로 Python 리스트로 한 번에 꺼내 캐시된 정규화 함수를 직접 호출
+    normalized = np.array([_normalize_text_cached(value) for value in uniques.tolist()], dtype=object)
+    return pd.Series(normalized[codes], index=series.index, name=series.name, dtype=TEXT_DTYPE)
+
+
+# 여러 컬럼을 한 번에 정규화: 컬럼 간 중복 값(사전 값과 JSON 값 등)도 한 번만 정규화
+
+def normalize_series_list(series_list: list[pd.Series]) -> list[pd.Series]:
+    if not series_list:
+        return []
+    normalized = normalize_series(pd.concat(series_list, ignore_index=True)).to_numpy(dtype=object)
+    result = []
+    offset = 0
+    for series in series_list:
+        size = len(series.index)
+        result.append(pd.Series(normalized[offset:offset + size], index=series.index, name=series.name, dtype=TEXT_DTYPE))
+        offset += size
+    return result
+
+
 def canonical_key(value) -> str:
-    text = normalize_text(value)
-    text = unicodedata.normalize("NFKC", text)
+    return _canonical_key_cached(normalize_text(value))
+
+
+# 언어별 JSON 인덱스를 만들 때 같은 키가 반복되므로 NFKC/공백 정리 결과를 캐시
+@lru_cache(maxsize=200000)
+def _canonical_key_cached(text: str) -> str:
+    # ASCII 문자열은 NFKC 결과가 자기 자신이므로 변환 생략
+    if not text.isascii():
+        text = unicodedata.normalize("NFKC", text)
     text = text.replace("\n", " ")
-    text = re.sub(r"\s+", " ", text).strip().lower()
+    text = _WHITESPACE_RUN_RE.sub(" ", text).strip().lower()
     return text
 
 
 # 헤더 이름 매칭 정확도를 올리기 위한 정규화
 
 def normalize_header_name(name: str) -> str:
-    text = str(name).strip().lower()
-    return re.sub(r"[^a-z0-9가-힣]+", "", text)
+    return _normalize_header_cached(str(name))
+
+
+# 같은 헤더/후보명이 guess_column 호출마다 반복되므로 캐시
+@lru_cache(maxsize=4096)
+def _normalize_header_cached(text: str) -> str:
+    return _HEADER_STRIP_RE.sub("", text.strip().lower())
+
+
+# 공백만 있는 값을 제외한 실제 값 개수(문자열 dtype은 .str 메서드로 계산해 string[pyarrow]면 Arrow 커널 사용)
+# 결측값(None/NaN/pd.NA)은 빈 값으로 취급
+
+def _string_nonempty_mask(series: pd.Series) -> pd.Series:
+    return series.str.strip().ne("") & series.notna()
+
+
+def nonempty_count(series: pd.Series) -> int:
+    if isinstance(series.dtype, pd.StringDtype):
+        return int(_string_nonempty_mask(series).sum())
+    return sum(1 for value in series.dropna().to_numpy(dtype=object) if str(value).strip())
+
+
+# 공백이 아닌 값이 하나라도 있는지 (Python 경로는 첫 값에서 바로 종료)
+
+def has_nonempty(series: pd.Series) -> bool:
+    if isinstance(series.dtype, pd.StringDtype):
+        return bool(_string_nonempty_mask(series).any())
+    return any(str(value).strip() for value in series.dropna().to_numpy(dtype=object))